@@ -0,0 +1,32 @@
+"""
+Popular algorithms and data structures implemented in Python 2.7.
+
+Importing the package (or any of its modules) does no work besides defining
+functions and classes: inputs are loaded, demos run and heavy optional
+engines (NumPy, multiprocessing, the snapshot reader, alternative shortest
+path and MST implementations) are imported only when they are used.
+
+Graphs
+dijkstra, bucket_dijkstra, contraction_hierarchy, dijkstra_batch, dynamic_sp,
+sp_cache                   # shortest paths
+prims_mst, kruskal_mst,
+parallel_mst               # minimum spanning trees
+scc                        # strongly connected components
+csr_graph, graph_loader,
+graph_snapshot             # graph representation, loading and snapshots
+
+Sorting and selection
+quick_sort, randomized_quick_sort, parallel_quick_sort, radix_sort,
+quick_select
+
+Scheduling
+activity_selection_iter, activity_selection_rec, activity_selection_batch,
+activity_schedule, interval_scheduling
+
+Data structures and tools
+disjoint, priority_queue, instrumentation, optional, cli
+
+Every algorithm with a command line interface has a main function, installed
+as a console script (see setup.py) and runnable as python -m algorithms.name.
+Sample inputs are in the data directory (see graph_loader.data_file).
+"""
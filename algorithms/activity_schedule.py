@@ -0,0 +1,285 @@
+"""
+Python implementation of an online schedule of mutually compatible activities
+for one resource (see activity_selection_iter.py for the problem). Activities
+are tuples (start, finish); two activities are compatible if one starts no
+earlier than the other finishes.
+
+Accepted activities are kept in a treap (a randomized balanced binary search
+tree) ordered by (start, finish). Since they don't overlap, their finish times
+are ordered too, so the only accepted activity that may conflict with a new
+one is the last one starting before the new one finishes. Every node also
+keeps the first start, the last finish and the largest free gap between
+consecutive activities in its subtree, which lets "next free slot" skip over
+busy stretches. All operations run in O(lg n) expected time.
+"""
+import random
+
+
+class Node(object):
+    """
+    Models a node of the treap with one activity.
+    """
+    __slots__ = ('start', 'finish', 'priority', 'left', 'right', 'lo', 'hi', 'gap')
+
+    def __init__(self, start, finish):
+        self.start, self.finish = start, finish
+        self.priority = random.random()
+        self.left = self.right = None
+        self.lo, self.hi, self.gap = start, finish, float('-inf')
+
+
+    def key(self):
+        return self.start, self.finish
+
+
+    def update(self):
+        """
+        Recomputes the first start, the last finish and the largest gap of the
+        subtree from the children.
+        """
+        left, right = self.left, self.right
+        gap = float('-inf')
+        if left is not None:
+            gap = max(left.gap, self.start - left.hi)
+        if right is not None:
+            gap = max(gap, right.gap, right.lo - self.finish)
+        self.lo = left.lo if left is not None else self.start
+        self.hi = right.hi if right is not None else self.finish
+        self.gap = gap
+
+
+def split(node, key):
+    """
+    Splits the treap into treaps of activities with keys smaller than key and
+    not smaller than key.
+    """
+    if node is None:
+        return None, None
+    if node.key() < key:
+        node.right, right = split(node.right, key)
+        node.update()
+        return node, right
+    left, node.left = split(node.left, key)
+    node.update()
+    return left, node
+
+
+def merge(left, right):
+    """
+    Merges two treaps, all keys of the left one being smaller.
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = merge(left.right, right)
+        left.update()
+        return left
+    right.left = merge(left, right.left)
+    right.update()
+    return right
+
+
+def delete(node, key):
+    """
+    Deletes the activity with the given key from the treap. Raises KeyError
+    if it's not there.
+    """
+    if node is None:
+        raise KeyError(key)
+    if key == node.key():
+        return merge(node.left, node.right)
+    if key < node.key():
+        node.left = delete(node.left, key)
+    else:
+        node.right = delete(node.right, key)
+    node.update()
+    return node
+
+
+class Schedule(object):
+    """
+    Set of mutually compatible activities supporting insertion, removal,
+    conflict checks and free slot queries.
+    """
+
+    def __init__(self, tasks=()):
+        self.root = None
+        self.size = 0
+        for start, finish in tasks:
+            self.insert(start, finish)
+
+
+    def __len__(self):
+        return self.size
+
+
+    def __iter__(self):
+        """
+        Generates accepted activities in order of start time.
+        """
+        stack, node = [], self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.start, node.finish
+            node = node.right
+
+
+    def last_before(self, time):
+        """
+        Returns the node of the last activity that starts before time (None
+        if there's no such activity).
+        """
+        node, found = self.root, None
+        while node is not None:
+            if node.start < time:
+                found, node = node, node.right
+            else:
+                node = node.left
+        return found
+
+
+    def conflict(self, start, finish):
+        """
+        Returns an accepted activity that isn't compatible with (start,
+        finish) or None if there's none.
+        """
+        node = self.last_before(finish)
+        if node is not None and node.finish > start:
+            return node.start, node.finish
+        return None
+
+
+    def can_insert(self, start, finish):
+        return self.conflict(start, finish) is None
+
+
+    def insert(self, start, finish):
+        """
+        Adds activity to the schedule. Raises ValueError if it's not
+        compatible with some accepted activity.
+        """
+        if finish < start:
+            raise ValueError("Activity (%s, %s) finishes before it starts" % (start, finish))
+        conflicting = self.conflict(start, finish)
+        if conflicting is not None:
+            raise ValueError("Activity (%s, %s) conflicts with %s" % (start, finish, conflicting))
+        left, right = split(self.root, (start, finish))
+        self.root = merge(merge(left, Node(start, finish)), right)
+        self.size += 1
+
+
+    def remove(self, start, finish):
+        """
+        Removes activity from the schedule. Raises KeyError if it's not there.
+        """
+        self.root = delete(self.root, (start, finish))
+        self.size -= 1
+
+
+    def next_free_slot(self, time, duration=0):
+        """
+        Returns the earliest start, not earlier than time, of an activity of
+        the given duration that is compatible with all accepted activities.
+        """
+        conflicting = self.last_before(time + duration)
+        if conflicting is None or conflicting.finish <= time:
+            return time
+        node = first_gap(self.root, conflicting.key(), duration, None)
+        return self.root.hi if node is None else node.finish
+
+
+    def insert_greedy(self, tasks):
+        """
+        Takes an iterable of activities ordered by finish time (a generator
+        works, nothing is buffered) and inserts every one that is compatible
+        with the schedule - the greedy earliest-finish rule. Generates the
+        inserted activities.
+        """
+        for start, finish in tasks:
+            if self.can_insert(start, finish):
+                self.insert(start, finish)
+                yield start, finish
+
+
+def first_gap(node, key, duration, next_start):
+    """
+    Returns the first node (in key order) with key not smaller than key that
+    is followed by a free gap of at least duration, or None if only the gap
+    after the last activity is long enough. Next_start is the start of the
+    activity following the subtree (None if there's none).
+    """
+    while node is not None:
+        if node.key() < key:
+            node = node.right
+            continue
+        found = first_gap(node.left, key, duration, node.start)
+        if found is not None:
+            return found
+        following = node.right.lo if node.right is not None else next_start
+        if following is None or following - node.finish >= duration:
+            return node
+        return first_gap_in(node.right, duration, next_start)
+    return None
+
+
+def first_gap_in(node, duration, next_start):
+    """
+    Returns the first node of the subtree followed by a free gap of at least
+    duration (see first_gap), skipping subtrees without such gaps.
+    """
+    while node is not None:
+        trailing = None if next_start is None else next_start - node.hi
+        if node.gap < duration and trailing is not None and trailing < duration:
+            return None
+        left = node.left
+        if left is not None and (left.gap >= duration or node.start - left.hi >= duration):
+            next_start, node = node.start, left
+            continue
+        following = node.right.lo if node.right is not None else next_start
+        if following is None or following - node.finish >= duration:
+            return node
+        node = node.right
+    return None
+
+
+def select_stream(tasks):
+    """
+    Takes an iterable of activities ordered by finish time and generates the
+    ones chosen by the greedy activity selection algorithm, keeping only the
+    finish time of the most recent one.
+    """
+    recent_finish = None
+    for start, finish in tasks:
+        if recent_finish is None or start >= recent_finish:
+            recent_finish = finish
+            yield start, finish
+
+
+def main(argv=None):
+    """
+    Inserts activities from a file (or the sample activities) into a
+    Schedule greedily by finish time and prints the accepted ones, then
+    answers the optional queries.
+    """
+    from .cli import load_tasks, tasks_parser
+    parser = tasks_parser("Schedules activities greedily and answers queries.")
+    parser.add_argument('--can-insert', type=int, nargs=2, metavar=('START', 'FINISH'))
+    parser.add_argument('--free-slot', type=int, nargs=2, metavar=('TIME', 'DURATION'),
+                        help="prints the start of the first free slot of duration after time")
+    args = parser.parse_args(argv)
+    schedule = Schedule()
+    print list(schedule.insert_greedy(sorted(load_tasks(args), key=lambda task: task[1])))
+    if args.can_insert:
+        print "Can insert (%s, %s): " % tuple(args.can_insert), schedule.can_insert(*args.can_insert)
+    if args.free_slot:
+        print "Next free slot of length %s after %s: " % (args.free_slot[1], args.free_slot[0]), \
+            schedule.next_free_slot(*args.free_slot)
+
+
+if __name__ == "__main__":
+    main()
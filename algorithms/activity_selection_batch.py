@@ -0,0 +1,118 @@
+"""
+Batch version of the greedy activity selection algorithm (see
+activity_selection_iter.py) for large inputs and for many independent
+schedules at once.
+
+Activities are given as two arrays - start times and finish times (lists,
+array.array or NumPy arrays) - instead of a list of tuples, and the selected
+activities are returned as an array of their indices in order of finish time.
+
+With NumPy all schedules are solved together: they're concatenated with
+their times shifted so they don't overlap, ordered with one lexsort, and for
+every activity the next activity chosen by the greedy rule after it is found
+with one searchsorted over the running maximum of start times. Walking these
+links costs one step per selected activity. Without NumPy (or if some
+activities take no time, when the links aren't well defined) the greedy scan
+runs over the sorted indices.
+"""
+from array import array
+
+from .optional import optional_import
+
+
+def order_by_ftime(starts, finishes):
+    """
+    Returns list of indices of activities ordered by monotonically increasing
+    finish times, breaking ties by start times.
+    """
+    order = sorted(xrange(len(starts)), key=starts.__getitem__)
+    order.sort(key=finishes.__getitem__)
+    return order
+
+
+def scan(starts, finishes, order):
+    """
+    Greedy scan over activities in the given order (by finish time). Returns
+    list of indices of selected activities.
+    """
+    selected = []
+    recent_finish = None
+    for index in order:
+        if recent_finish is None or starts[index] >= recent_finish:
+            selected.append(index)
+            recent_finish = finishes[index]
+    return selected
+
+
+def select_activity_batch(starts, finishes):
+    """
+    Takes arrays of start and finish times of activities. Returns array of
+    indices of a maximum-size set of mutually compatible activities, ordered
+    by finish time.
+    """
+    return select_activity_many([(starts, finishes)])[0]
+
+
+def select_activity_many(schedules):
+    """
+    Takes an iterable of (starts, finishes) pairs of arrays, each of them an
+    independent schedule. Returns list of arrays of indices of the selected
+    activities of every schedule (NumPy arrays if NumPy is available).
+    """
+    schedules = list(schedules)
+    numpy = optional_import('numpy')
+    if numpy is None:
+        return [array('l', scan(starts, finishes, order_by_ftime(starts, finishes)))
+                for starts, finishes in schedules]
+    starts = [numpy.asarray(schedule[0]) for schedule in schedules]
+    finishes = [numpy.asarray(schedule[1]) for schedule in schedules]
+    lengths = numpy.array([len(start) for start in starts], dtype=numpy.int64)
+    ends = numpy.cumsum(lengths)
+    beginnings = ends - lengths
+    if not lengths.sum():
+        return [numpy.empty(0, dtype=numpy.int64) for _ in schedules]
+    start = numpy.concatenate(starts)
+    finish = numpy.concatenate(finishes)
+    group = numpy.repeat(numpy.arange(len(schedules)), lengths)
+    # Schedule number is the primary key, then finish and start time.
+    order = numpy.lexsort((start, finish, group))
+    start, finish = start[order], finish[order]
+    selected = []
+    if (start == finish).any():
+        for number in xrange(len(schedules)):
+            positions = scan(start, finish, xrange(beginnings[number], ends[number]))
+            selected.append(order[positions] - beginnings[number])
+        return selected
+    # Shifts schedules so the times of every schedule exceed all earlier ones.
+    low = min(start.min(), finish.min())
+    width = max(start.max(), finish.max()) - low + 1
+    shift = (group[order] * width - low).astype(numpy.result_type(start, width))
+    start, finish = start + shift, finish + shift
+    # The first activity (in finish order) that starts no earlier than f is
+    # the first position where the running maximum of starts reaches f.
+    following = numpy.searchsorted(numpy.maximum.accumulate(start), finish, 'left')
+    for number in xrange(len(schedules)):
+        positions = []
+        position, end = beginnings[number], ends[number]
+        while position < end:
+            positions.append(position)
+            position = following[position]
+        selected.append(order[numpy.array(positions, dtype=numpy.int64)] - beginnings[number])
+    return selected
+
+
+def main(argv=None):
+    """
+    Prints a maximum-size set of mutually compatible activities from a file
+    (or the sample activities).
+    """
+    from .cli import load_tasks, tasks_parser
+    args = tasks_parser("Selects a maximum-size set of compatible activities.").parse_args(argv)
+    tasks = load_tasks(args)
+    starts = array('l', (task[0] for task in tasks))
+    finishes = array('l', (task[1] for task in tasks))
+    print [tasks[index] for index in select_activity_batch(starts, finishes)]
+
+
+if __name__ == "__main__":
+    main()
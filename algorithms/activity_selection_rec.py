@@ -44,7 +44,7 @@ def main(to_be_scheduled):
     """
     to_be_scheduled.append((0, 0))
     tasks = order_by_ftime(to_be_scheduled)
-    print select_activity(tasks, 0, 11)
+    print select_activity(tasks, 0, len(tasks) - 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,227 @@
+"""
+Variants of Dijkstra's shortest path algorithm for graphs with small,
+non-negative integer edge lengths, which replace the comparison-based heap of
+dijkstra.dijkstra with a monotone integer priority queue:
+
+dial            # circular array of C + 1 buckets, O(E + V C) for maximum
+                  length C
+radix_dijkstra  # radix heap, O(E + V lg C)
+delta_stepping  # buckets of width delta; the relaxations of all vertices in a
+                  bucket are gathered as one batch of requests
+auto_dijkstra   # picks one of the above (or dijkstra) from the edge lengths
+
+All of them take a graph modeled as a dictionary of dictionaries or a weighted
+csr_graph.CSRGraph and return (sp_estimate, predecessors) just like
+dijkstra.dijkstra.
+"""
+from .dijkstra import adjacency, dijkstra, load_graph
+from .graph_loader import data_file
+
+DIAL_MAX_WEIGHT = 256
+# Engines selectable from the command line (see main).
+ENGINES = ('dial', 'radix_dijkstra', 'delta_stepping', 'auto_dijkstra')
+
+
+def max_edge_weight(digraph):
+    """
+    Returns the maximum length of an edge of the graph (0 if it has no edges).
+    """
+    if hasattr(digraph, 'weights'):
+        return max(digraph.weights) if digraph.weights else 0
+    return max([max(adjacent.itervalues()) for adjacent in digraph.itervalues()
+                if adjacent] or [0])
+
+
+def has_integer_weights(digraph):
+    """
+    Tests whether all edge lengths of the graph are non-negative integers.
+    """
+    if hasattr(digraph, 'weights'):
+        weights = digraph.weights
+        if weights is not None and weights.typecode in 'fd':
+            return all(weight >= 0 and weight == int(weight) for weight in weights)
+        return not weights or min(weights) >= 0
+    return all(isinstance(weight, (int, long)) and weight >= 0
+               for adjacent in digraph.itervalues() for weight in adjacent.itervalues())
+
+
+def dial(digraph, source=1, max_weight=None):
+    """
+    Dial's algorithm. Vertices wait in a circular array of max_weight + 1
+    buckets indexed by their shortest-path estimate modulo max_weight + 1 -
+    all estimates in the queue differ by at most max_weight, so the buckets
+    never mix. Buckets are scanned in order of increasing distance.
+    """
+    inf = float('inf')
+    if max_weight is None:
+        max_weight = max_edge_weight(digraph)
+    size = max_weight + 1
+    buckets = [[] for _ in xrange(size)]
+    buckets[0].append(source)
+    queued = 1
+    sp_estimate = {source: 0}
+    predecessors = {}
+    adjacent = adjacency(digraph)
+    dist = 0
+    while queued:
+        bucket = buckets[dist % size]
+        while bucket:
+            shortest = bucket.pop()
+            queued -= 1
+            if sp_estimate[shortest] != dist:
+                continue # Outdated entry, the vertex was moved to a closer bucket.
+            for adj_vertex, weight in adjacent(shortest):
+                estimate = dist + weight
+                if estimate < sp_estimate.get(adj_vertex, inf):
+                    sp_estimate[adj_vertex], predecessors[adj_vertex] = estimate, shortest
+                    buckets[estimate % size].append(adj_vertex)
+                    queued += 1
+        dist += 1
+    return sp_estimate, predecessors
+
+
+class RadixHeap(object):
+    """
+    Monotone min-priority queue of non-negative integer keys: popped keys never
+    decrease and pushed keys are never smaller than the last popped one.
+    Bucket i holds entries whose keys first differ from the last popped key at
+    bit i - 1 (bucket 0 holds keys equal to it), so every entry moves to a
+    lower bucket at most lg C times.
+    """
+
+    def __init__(self):
+        self.last = 0
+        self.buckets = [[]]
+        self.size = 0
+
+
+    def __len__(self):
+        return self.size
+
+
+    def push(self, key, item):
+        index = (key ^ self.last).bit_length()
+        buckets = self.buckets
+        if index >= len(buckets):
+            buckets.extend([] for _ in xrange(index + 1 - len(buckets)))
+        buckets[index].append((key, item))
+        self.size += 1
+
+
+    def pop(self):
+        buckets = self.buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            bucket = buckets[index]
+            buckets[index] = []
+            self.last = last = min(bucket)[0]
+            for entry in bucket:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self.size -= 1
+        return buckets[0].pop()
+
+
+def radix_dijkstra(digraph, source=1):
+    """
+    Dijkstra's algorithm with a radix heap as the min-priority queue.
+    """
+    inf = float('inf')
+    sp_estimate = {source: 0}
+    predecessors = {}
+    queue = RadixHeap()
+    queue.push(0, source)
+    adjacent = adjacency(digraph)
+    while queue:
+        dist, shortest = queue.pop()
+        if dist != sp_estimate[shortest]:
+            continue
+        for adj_vertex, weight in adjacent(shortest):
+            estimate = dist + weight
+            if estimate < sp_estimate.get(adj_vertex, inf):
+                sp_estimate[adj_vertex], predecessors[adj_vertex] = estimate, shortest
+                queue.push(estimate, adj_vertex)
+    return sp_estimate, predecessors
+
+
+def delta_stepping(digraph, source=1, delta=None):
+    """
+    Delta-stepping algorithm. Vertices are kept in buckets of estimates
+    [i delta, (i + 1) delta). The lowest non-empty bucket is emptied
+    repeatedly: relaxation requests along light edges (not longer than delta)
+    of all its vertices are gathered first and then applied, which may refill
+    the bucket. Heavy edges of all vertices settled in the bucket are relaxed
+    once at the end. Each batch of requests is independent of the order in
+    which it's computed. Delta defaults to the maximum edge length.
+    """
+    inf = float('inf')
+    if delta is None:
+        delta = max(max_edge_weight(digraph), 1)
+    sp_estimate = {source: 0}
+    predecessors = {}
+    buckets = {0: set([source])}
+    adjacent = adjacency(digraph)
+
+    def relax(requests):
+        for adj_vertex, estimate, shortest in requests:
+            old_estimate = sp_estimate.get(adj_vertex, inf)
+            if estimate < old_estimate:
+                if old_estimate != inf:
+                    buckets.get(int(old_estimate // delta), set()).discard(adj_vertex)
+                buckets.setdefault(int(estimate // delta), set()).add(adj_vertex)
+                sp_estimate[adj_vertex], predecessors[adj_vertex] = estimate, shortest
+
+    while buckets:
+        index = min(buckets)
+        settled = []
+        while buckets.get(index):
+            frontier = buckets.pop(index)
+            settled.extend(frontier)
+            relax([(adj_vertex, sp_estimate[vertex] + weight, vertex)
+                   for vertex in frontier for adj_vertex, weight in adjacent(vertex)
+                   if weight <= delta])
+        buckets.pop(index, None)
+        relax([(adj_vertex, sp_estimate[vertex] + weight, vertex)
+               for vertex in settled for adj_vertex, weight in adjacent(vertex)
+               if weight > delta])
+    return sp_estimate, predecessors
+
+
+def auto_dijkstra(digraph, source=1):
+    """
+    Picks the shortest-path engine from the edge lengths of the graph: Dial's
+    algorithm if they're integers not greater than DIAL_MAX_WEIGHT, the radix
+    heap for other non-negative integers and dijkstra.dijkstra otherwise.
+    """
+    if not has_integer_weights(digraph):
+        return dijkstra(digraph, source)
+    max_weight = max_edge_weight(digraph)
+    if max_weight <= DIAL_MAX_WEIGHT:
+        return dial(digraph, source, max_weight)
+    return radix_dijkstra(digraph, source)
+
+
+def main(argv=None):
+    """
+    Prints the shortest-path distances from the source vertex, computed by the
+    chosen engine (auto_dijkstra by default).
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Computes shortest-path distances with integer priority queues.")
+    parser.add_argument('graph_file', nargs='?', default=data_file('dijkstra.txt'),
+                        help="text file or snapshot (see dijkstra.load_graph)")
+    parser.add_argument('--source', type=int, default=1)
+    parser.add_argument('--engine', choices=ENGINES, default='auto_dijkstra')
+    parser.add_argument('--delta', type=int, help="bucket width of delta_stepping")
+    args = parser.parse_args(argv)
+    digraph = load_graph(args.graph_file)
+    if args.engine == 'delta_stepping':
+        print delta_stepping(digraph, args.source, args.delta)[0]
+    else:
+        engines = {'dial': dial, 'radix_dijkstra': radix_dijkstra, 'auto_dijkstra': auto_dijkstra}
+        print engines[args.engine](digraph, args.source)[0]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Helpers shared by the command lines of the sorting, selection and scheduling
+modules (see their main functions).
+
+Numbers and activities are read with graph_loader.read_columns, so the files
+may be compressed. Without a file the commands run on random integers or on
+the sample activities of the scheduling demos.
+"""
+import random
+import time
+
+from .graph_loader import read_columns
+
+# Activities used by the scheduling demos when no file is given.
+SAMPLE_TASKS = [(5, 9), (1, 4), (2, 14), (0, 6), (6, 10), (3, 9), (5, 7), (12, 16),
+                (3, 5), (8, 12), (8, 11)]
+SAMPLE_WEIGHTS = [3, 2, 10, 4, 2, 5, 1, 6, 2, 4, 3]
+
+
+def numbers_parser(description, size=100):
+    """
+    Returns argparse.ArgumentParser with the arguments read by load_numbers:
+    an optional file of integers, or the size and seed of random input.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('numbers_file', nargs='?',
+                        help="text file of whitespace separated integers "
+                        "(random integers by default)")
+    parser.add_argument('--size', type=int, default=size, help="number of random integers")
+    parser.add_argument('--seed', type=int, default=0)
+    return parser
+
+
+def load_numbers(args):
+    """
+    Returns list of integers from args.numbers_file, or args.size random
+    integers between -args.size and args.size.
+    """
+    if args.numbers_file is not None:
+        return read_columns(args.numbers_file, 'l')[0].tolist()
+    rand = random.Random(args.seed)
+    return [rand.randint(-args.size, args.size) for _ in xrange(args.size)]
+
+
+def sort_main(description, methods, argv=None):
+    """
+    Command line of a sorting module. Methods is a list of (name, function
+    sorting a list in place) pairs, the first one is the default. Sorts the
+    numbers (see load_numbers) and prints them (unless --quiet), the time and
+    whether the result is sorted.
+    """
+    parser = numbers_parser(description)
+    if len(methods) > 1:
+        parser.add_argument('--method', choices=[name for name, _ in methods],
+                            default=methods[0][0])
+    parser.add_argument('--quiet', action='store_true', help="doesn't print the sorted numbers")
+    args = parser.parse_args(argv)
+    sort = dict(methods)[getattr(args, 'method', methods[0][0])]
+    numbers = load_numbers(args)
+    start = time.time()
+    sort(numbers)
+    seconds = time.time() - start
+    if not args.quiet:
+        print numbers
+    print "Sorted %s numbers in %.3f s, correctly sorted: %s" % (
+        len(numbers), seconds, all(numbers[index] <= numbers[index + 1]
+                                   for index in xrange(len(numbers) - 1)))
+
+
+def tasks_parser(description):
+    """
+    Returns argparse.ArgumentParser with the arguments read by load_tasks.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('tasks_file', nargs='?',
+                        help="text file of \"start finish\" rows (the sample activities by default)")
+    return parser
+
+
+def load_tasks(args, weighted=False):
+    """
+    Returns list of (start, finish) tuples from args.tasks_file (or the
+    sample activities). If weighted, rows are "start finish weight" and a
+    tuple (tasks, weights) is returned.
+    """
+    if args.tasks_file is None:
+        return (SAMPLE_TASKS, SAMPLE_WEIGHTS) if weighted else SAMPLE_TASKS
+    columns = read_columns(args.tasks_file, 'lll' if weighted else 'll')
+    tasks = zip(columns[0], columns[1])
+    return (tasks, columns[2].tolist()) if weighted else tasks
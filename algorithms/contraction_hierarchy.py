@@ -0,0 +1,303 @@
+"""
+Contraction hierarchies - preprocessing of a static, weighted, directed graph
+that makes repeated shortest-path queries explore only a small part of it.
+
+Vertices are contracted one by one in order of importance (edge difference plus
+the number of already contracted neighbours, updated lazily). Contracting
+vertex v removes it from the remaining graph and adds a shortcut (u, x) of
+length w(u, v) + w(v, x) for every pair of its neighbours unless a local
+witness search finds a path from u to x that avoids v and isn't longer. The
+position of a vertex in the contraction order is its rank.
+
+A query runs Dijkstra's algorithm forward from the source along edges to
+higher-ranked vertices and backward from the target along reversed edges to
+higher-ranked vertices, and returns the same distance as dijkstra.dijkstra.
+Shortcuts remember the contracted vertex, so paths are unpacked to edges of
+the original graph.
+
+The hierarchy is saved to (and loaded from) a text file:
+[number_of_nodes] [number_of_edges]
+[vertex] [rank]                           # number_of_nodes rows
+[tail] [head] [length] [contracted_vertex] # number_of_edges rows, the last
+                                            column is -1 for original edges
+"""
+from heapq import heappush, heappop
+
+from .dijkstra import dijkstra, load_graph
+from .graph_loader import data_file
+
+WITNESS_SETTLED_LIMIT = 64
+
+
+class ContractionHierarchy(object):
+    """
+    Models a graph augmented with shortcuts. Rank maps vertices to their
+    contraction order and edges maps (tail, head) to (length, contracted
+    vertex or None). The number of vertices settled by the last query is kept
+    in settled.
+    """
+
+    def __init__(self, rank, edges):
+        self.rank = rank
+        self.edges = edges
+        self.settled = 0
+        self.upward, self.downward = {}, {}
+        for (tail, head), (weight, _) in edges.iteritems():
+            if rank[head] > rank[tail]:
+                self.upward.setdefault(tail, {})[head] = weight
+            else:
+                self.downward.setdefault(head, {})[tail] = weight
+
+
+    def query(self, source, target):
+        """
+        Returns the shortest-path distance from source to target (inf if the
+        target is unreachable) and the path as a list of vertices of the
+        original graph.
+        """
+        inf = float('inf')
+        graphs = (self.upward, self.downward)
+        sp_estimates = ({source: 0}, {target: 0})
+        predecessors = ({}, {})
+        queues = ([(0, source)], [(0, target)])
+        best, meeting = (0, source) if source == target else (inf, None)
+        self.settled = 0
+        while queues[0] or queues[1]:
+            for side in (0, 1):
+                queue = queues[side]
+                if not queue:
+                    continue
+                dist, shortest = heappop(queue)
+                sp_estimate = sp_estimates[side]
+                if dist > sp_estimate[shortest]:
+                    continue
+                if dist >= best:
+                    del queue[:] # Nothing on this side can improve the path.
+                    continue
+                self.settled += 1
+                other_dist = sp_estimates[1 - side].get(shortest)
+                if other_dist is not None and dist + other_dist < best:
+                    best, meeting = dist + other_dist, shortest
+                for adj_vertex, weight in graphs[side].get(shortest, {}).iteritems():
+                    if dist + weight < sp_estimate.get(adj_vertex, inf):
+                        sp_estimate[adj_vertex] = dist + weight
+                        predecessors[side][adj_vertex] = shortest
+                        heappush(queue, (dist + weight, adj_vertex))
+        if meeting is None:
+            return best, []
+        path = [meeting]
+        while path[-1] != source:
+            path.append(predecessors[0][path[-1]])
+        path.reverse()
+        while path[-1] != target:
+            path.append(predecessors[1][path[-1]])
+        return best, self.unpack(path)
+
+
+    def unpack(self, path):
+        """
+        Replaces every shortcut in the path with the edges it stands for.
+        """
+        unpacked = [path[0]]
+        for tail, head in zip(path, path[1:]):
+            stack = [(tail, head)]
+            while stack:
+                tail, head = stack.pop()
+                middle = self.edges[tail, head][1]
+                if middle is None:
+                    unpacked.append(head)
+                else:
+                    stack.append((middle, head))
+                    stack.append((tail, middle))
+        return unpacked
+
+
+    def save(self, file_name):
+        with open(file_name, 'w') as opened:
+            opened.write('%s %s\n' % (len(self.rank), len(self.edges)))
+            for vertex, rank in self.rank.iteritems():
+                opened.write('%s %s\n' % (vertex, rank))
+            for (tail, head), (weight, middle) in self.edges.iteritems():
+                opened.write('%s %s %s %s\n' % (tail, head, weight,
+                                                -1 if middle is None else middle))
+
+
+    @classmethod
+    def load(cls, file_name):
+        with open(file_name) as opened:
+            nodes_num, edges_num = map(int, opened.readline().split())
+            rank = {}
+            for _ in xrange(nodes_num):
+                vertex, vertex_rank = map(int, opened.readline().split())
+                rank[vertex] = vertex_rank
+            edges = {}
+            for _ in xrange(edges_num):
+                line = opened.readline().split()
+                middle = int(line[3])
+                edges[int(line[0]), int(line[1])] = (int(line[2]),
+                                                     None if middle == -1 else middle)
+        return cls(rank, edges)
+
+
+def witness_search(out_edges, source, excluded, max_dist, limit=WITNESS_SETTLED_LIMIT):
+    """
+    Runs Dijkstra's algorithm from source in the remaining graph, skipping the
+    excluded vertex, until max_dist is exceeded or limit vertices are settled.
+    Returns dictionary of (upper bounds on) distances.
+    """
+    inf = float('inf')
+    sp_estimate = {source: 0}
+    queue = [(0, source)]
+    settled = 0
+    while queue and settled < limit:
+        dist, shortest = heappop(queue)
+        if dist > sp_estimate[shortest]:
+            continue
+        if dist > max_dist:
+            break
+        settled += 1
+        for adj_vertex, weight in out_edges[shortest].iteritems():
+            if adj_vertex != excluded and dist + weight < sp_estimate.get(adj_vertex, inf):
+                sp_estimate[adj_vertex] = dist + weight
+                heappush(queue, (dist + weight, adj_vertex))
+    return sp_estimate
+
+
+def shortcuts(out_edges, in_edges, vertex):
+    """
+    Returns list of (tail, head, length) shortcuts needed to contract vertex.
+    """
+    inf = float('inf')
+    needed = []
+    if not out_edges[vertex]:
+        return needed
+    max_out = max(out_edges[vertex].itervalues())
+    for tail, in_weight in in_edges[vertex].iteritems():
+        witness = witness_search(out_edges, tail, vertex, in_weight + max_out)
+        for head, out_weight in out_edges[vertex].iteritems():
+            if head != tail and witness.get(head, inf) > in_weight + out_weight:
+                needed.append((tail, head, in_weight + out_weight))
+    return needed
+
+
+def contract(digraph):
+    """
+    Takes a weighted, directed graph modeled as a dictionary of dictionaries
+    (see dijkstra.load_graph). Contracts all its vertices and returns the
+    ContractionHierarchy.
+    """
+    out_edges = dict((vertex, {}) for vertex in digraph)
+    in_edges = dict((vertex, {}) for vertex in digraph)
+    edges = {}
+    for tail, adjacent in digraph.iteritems():
+        for head, weight in adjacent.iteritems():
+            if tail == head:
+                continue
+            out_edges.setdefault(head, {})
+            in_edges.setdefault(head, {})
+            out_edges[tail][head] = in_edges[head][tail] = weight
+            edges[tail, head] = (weight, None)
+    deleted_neighbours = dict.fromkeys(out_edges, 0)
+
+    def importance(vertex):
+        return (len(shortcuts(out_edges, in_edges, vertex)) - len(in_edges[vertex])
+                - len(out_edges[vertex]) + deleted_neighbours[vertex])
+
+    queue = [(importance(vertex), vertex) for vertex in out_edges]
+    queue.sort()
+    rank = {}
+    while queue:
+        _, vertex = heappop(queue)
+        # Lazy update: importance may have grown since it was pushed.
+        priority = importance(vertex)
+        if queue and priority > queue[0][0]:
+            heappush(queue, (priority, vertex))
+            continue
+        for tail, head, weight in shortcuts(out_edges, in_edges, vertex):
+            if weight < out_edges[tail].get(head, float('inf')):
+                out_edges[tail][head] = in_edges[head][tail] = weight
+                edges[tail, head] = (weight, vertex)
+        for tail in in_edges[vertex]:
+            del out_edges[tail][vertex]
+            deleted_neighbours[tail] += 1
+        for head in out_edges[vertex]:
+            del in_edges[head][vertex]
+            deleted_neighbours[head] += 1
+        del out_edges[vertex], in_edges[vertex]
+        rank[vertex] = len(rank)
+    return ContractionHierarchy(rank, edges)
+
+
+def self_test(graphs_num=60, vertices_num=30, edges_num=90, seed=0):
+    """
+    Contracts graphs_num random digraphs and compares the query of every pair
+    of their vertices with dijkstra.dijkstra: the distances must be equal and
+    the unpacked path must consist of edges of the graph and be that long.
+    Returns list of (graph number, source, target) of pairs that failed.
+    """
+    import random
+    rand = random.Random(seed)
+    inf = float('inf')
+    failed = []
+    for number in xrange(graphs_num):
+        digraph = dict((vertex, {}) for vertex in xrange(1, vertices_num + 1))
+        for _ in xrange(edges_num):
+            tail, head = rand.randint(1, vertices_num), rand.randint(1, vertices_num)
+            digraph[tail][head] = rand.randint(1, 20)
+        hierarchy = contract(digraph)
+        for source in digraph:
+            shortest_paths = dijkstra(digraph, source)[0]
+            for target in digraph:
+                dist, path = hierarchy.query(source, target)
+                expected = shortest_paths.get(target, inf)
+                if dist == inf:
+                    valid = expected == inf and path == []
+                else:
+                    valid = (path[0] == source and path[-1] == target and
+                             all(head in digraph[tail] for tail, head in zip(path, path[1:])) and
+                             sum(digraph[tail][head] for tail, head in zip(path, path[1:])) == dist)
+                if dist != expected or not valid:
+                    failed.append((number, source, target))
+    return failed
+
+
+def main(argv=None):
+    """
+    Contracts a graph (or loads a saved hierarchy) and prints the distance and
+    the path of every query, by default from vertex 1 to every vertex of the
+    sample graph next to the distance found by dijkstra.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Answers shortest-path queries with a contraction hierarchy.")
+    parser.add_argument('graph_file', nargs='?', default=data_file('dijkstra.txt'),
+                        help="text file or snapshot (see dijkstra.load_graph)")
+    parser.add_argument('--query', type=int, nargs=2, action='append', metavar=('SOURCE', 'TARGET'),
+                        help="may be repeated (from 1 to every vertex, compared with dijkstra, by default)")
+    parser.add_argument('--load', metavar='HIERARCHY_FILE', help="uses a saved hierarchy instead of contracting")
+    parser.add_argument('--save', metavar='HIERARCHY_FILE')
+    parser.add_argument('--self-test', action='store_true',
+                        help="compares queries with dijkstra on random graphs (see self_test)")
+    args = parser.parse_args(argv)
+    if args.self_test:
+        print "Pairs of random graphs disagreeing with dijkstra:", self_test()
+        return
+    if args.load:
+        hierarchy = ContractionHierarchy.load(args.load)
+    else:
+        digraph = load_graph(args.graph_file)
+        hierarchy = contract(digraph)
+    if args.save:
+        hierarchy.save(args.save)
+    if args.query:
+        for source, target in args.query:
+            print source, target, hierarchy.query(source, target)
+        return
+    if args.load:
+        digraph = load_graph(args.graph_file)
+    shortest_paths = dijkstra(digraph, 1)[0]
+    for target in sorted(digraph):
+        print target, hierarchy.query(1, target), shortest_paths[target]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Compressed sparse row (CSR) representation of a directed, optionally weighted
+graph.
+
+Vertices are labeled with integers. Adjacency of all vertices is kept in three
+typed arrays instead of dictionaries of Python lists:
+
+offsets  # offsets[v] .. offsets[v + 1] is the range of edges leaving vertex v
+targets  # targets[k] is the head of the edge k
+weights  # weights[k] is the length of the edge k (None for unweighted graphs)
+
+Labels below "first" are padding (the input files label vertices from 1), so
+offsets can be indexed with vertex labels directly. The transpose is built
+from the arrays with a counting sort, without parsing the input again. With
+NumPy (optional) the counting sort runs on whole arrays at once.
+
+A CSRGraph can be passed directly to scc.dfs_order/dfs_leaders,
+dijkstra.dijkstra and prims_mst.mst_prim.
+"""
+
+from array import array
+from itertools import izip
+
+from .graph_loader import read_columns
+from .optional import optional_import
+
+
+class CSRGraph(object):
+    """
+    Models a directed graph in compressed sparse row format. graph[v] returns
+    heads of the edges leaving v, graph.adjacent(v) returns (head, weight)
+    pairs for weighted graphs.
+    """
+
+    def __init__(self, offsets, targets, weights=None, first=1):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.first = first
+
+
+    @classmethod
+    def from_edges(cls, edges, nodes_num=None, first=1, symmetric=False, weight_type='l'):
+        """
+        Takes an iterable of (tail, head) or (tail, head, weight) tuples, the
+        number of vertices (by default the highest label decides) and the label
+        of the first vertex. If symmetric is True every edge is added in both
+        directions, which models an undirected graph.
+        """
+        tails, heads, weights = array('i'), array('i'), None
+        for edge in edges:
+            tails.append(edge[0])
+            heads.append(edge[1])
+            if len(edge) > 2:
+                if weights is None:
+                    weights = array(weight_type)
+                weights.append(edge[2])
+        return cls._build(tails, heads, weights, nodes_num, first, symmetric)
+
+
+    @classmethod
+    def from_arrays(cls, tails, heads, weights=None, nodes_num=None, first=1, symmetric=False):
+        """
+        Takes edges as parallel arrays of tails, heads and (optionally)
+        weights, for ex. from graph_loader.read_columns (see from_edges).
+        """
+        return cls._build(tails, heads, weights, nodes_num, first, symmetric)
+
+
+    @classmethod
+    def from_adjacency(cls, adjacency, first=1, weight_type='l'):
+        """
+        Takes a graph modeled as a dictionary - of dictionaries {head: weight}
+        (dijkstra.load_graph), of lists of (head, weight) tuples
+        (prims_mst.load_graph) or of lists of heads (scc.loadgraph) - and
+        returns it in CSR format.
+        """
+        def edges():
+            for tail, adjacent in adjacency.iteritems():
+                if isinstance(adjacent, dict):
+                    adjacent = adjacent.iteritems()
+                for head in adjacent:
+                    if isinstance(head, tuple):
+                        yield (tail, ) + head
+                    else:
+                        yield tail, head
+        nodes_num = max(adjacency) - first + 1 if adjacency else 0
+        return cls.from_edges(edges(), nodes_num, first, weight_type=weight_type)
+
+
+    @classmethod
+    def from_file(cls, file_name, weighted=False, symmetric=False, nodes_num=None,
+                  first=1, weight_type='l'):
+        """
+        Loads graph from a file in which every row is an edge "tail head" (or
+        "tail head weight" if weighted), possibly compressed, with
+        graph_loader.read_columns. A shorter first row (the
+        "[number_of_nodes] [number_of_edges]" header of the Kruskal's and
+        Prim's inputs) is skipped.
+        """
+        if weighted:
+            tails, heads, weights = read_columns(file_name, 'ii' + weight_type)
+        else:
+            (tails, heads), weights = read_columns(file_name, 'ii'), None
+        return cls._build(tails, heads, weights, nodes_num, first, symmetric)
+
+
+    @classmethod
+    def _build(cls, tails, heads, weights, nodes_num, first, symmetric=False):
+        """
+        Groups edges given as parallel arrays by their tails using a counting
+        sort (stable, O(V + E)).
+        """
+        if symmetric:
+            tails, heads = tails + heads, heads + tails
+            if weights is not None:
+                weights = weights + weights
+        if tails and optional_import('numpy') is not None:
+            return cls._build_numpy(tails, heads, weights, nodes_num, first)
+        size = max(tails) + 1 if tails else 0
+        size = max(size, max(heads) + 1 if heads else 0, first)
+        if nodes_num is not None:
+            size = max(size, nodes_num + first)
+        offsets = array('l', [0]) * (size + 1)
+        for tail in tails:
+            offsets[tail + 1] += 1
+        for vertex in xrange(size):
+            offsets[vertex + 1] += offsets[vertex]
+        position = offsets[:size]
+        targets = array('i', [0]) * len(heads)
+        sorted_weights = None
+        if weights is not None:
+            sorted_weights = array(weights.typecode, [0]) * len(weights)
+        if weights is None:
+            for tail, head in izip(tails, heads):
+                slot = position[tail]
+                position[tail] = slot + 1
+                targets[slot] = head
+        else:
+            for tail, head, weight in izip(tails, heads, weights):
+                slot = position[tail]
+                position[tail] = slot + 1
+                targets[slot] = head
+                sorted_weights[slot] = weight
+        return cls(offsets, targets, sorted_weights, first)
+
+
+    @classmethod
+    def _build_numpy(cls, tails, heads, weights, nodes_num, first):
+        """
+        Same as _build, with the counting sort done by NumPy: edge indices are
+        ordered by sorting the unique keys tail * E + index (much faster than
+        a stable argsort), offsets are the cumulative sum of tail counts.
+        """
+        numpy = optional_import('numpy')
+
+        def to_numpy(values):
+            return numpy.frombuffer(values, dtype=values.typecode)
+
+        def to_array(typecode, values):
+            converted = array(typecode)
+            converted.fromstring(values.astype(typecode).tostring())
+            return converted
+
+        tail_values, head_values = to_numpy(tails), to_numpy(heads)
+        size = max(tail_values.max(), head_values.max()) + 1
+        size = max(size, first) if nodes_num is None else max(size, first, nodes_num + first)
+        edges_num = len(tail_values)
+        if size * edges_num < 2 ** 63:
+            keys = tail_values.astype(numpy.int64) * edges_num + numpy.arange(edges_num)
+            keys.sort()
+            order = keys % edges_num
+        else:
+            order = numpy.argsort(tail_values, kind='mergesort')
+        counts = numpy.bincount(tail_values, minlength=size)
+        offsets = to_array('l', numpy.concatenate(([0], numpy.cumsum(counts))))
+        targets = to_array('i', head_values[order])
+        if weights is not None:
+            weights = to_array(weights.typecode, to_numpy(weights)[order])
+        return cls(offsets, targets, weights, first)
+
+
+    def transpose(self):
+        """
+        Returns the graph with all edges reversed (with their weights).
+        """
+        offsets = self.offsets
+        numpy = optional_import('numpy')
+        if numpy is not None:
+            tails = array('i')
+            tails.fromstring(numpy.repeat(numpy.arange(len(offsets) - 1, dtype='i'),
+                                          numpy.diff(numpy.frombuffer(offsets, dtype='l'))).tostring())
+        else:
+            tails = array('i', [0]) * len(self.targets)
+            for vertex in xrange(len(offsets) - 1):
+                for index in xrange(offsets[vertex], offsets[vertex + 1]):
+                    tails[index] = vertex
+        return self._build(self.targets, tails, self.weights,
+                           len(self), self.first)
+
+
+    def keys(self):
+        return xrange(self.first, len(self.offsets) - 1)
+
+
+    def __iter__(self):
+        return iter(self.keys())
+
+
+    def __len__(self):
+        return len(self.offsets) - 1 - self.first
+
+
+    def __contains__(self, vertex):
+        return self.first <= vertex < len(self.offsets) - 1
+
+
+    def __getitem__(self, vertex):
+        """
+        Returns array of heads of the edges leaving vertex.
+        """
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+
+    def adjacent(self, vertex):
+        """
+        Returns list of (head, weight) tuples of the edges leaving vertex (or
+        array of heads if the graph is unweighted).
+        """
+        begin, end = self.offsets[vertex], self.offsets[vertex + 1]
+        if self.weights is None:
+            return self.targets[begin:end]
+        return zip(self.targets[begin:end], self.weights[begin:end])
+
+
+    @property
+    def edges_num(self):
+        return len(self.targets)
+
+
+    def __str__(self):
+        representation = ''
+        for vertex in self.keys():
+            representation += '%s: %s' % (vertex, self.adjacent(vertex)) + '\n'
+        return representation
@@ -0,0 +1,244 @@
+"""
+Python implementation of Dijkstra's shortest path algorithm. It was written for
+the programming assignment for 'Graph Search, Shortest Paths, and Data
+Structures' by Stanford University on Coursera.
+"""
+from heapq import heappush, heappop
+import heapq
+import time
+
+from .graph_loader import data_file, is_snapshot, load_adjacency
+
+# Engines selectable from the command line (see main), all but dijkstra from
+# bucket_dijkstra.
+ENGINES = ('dijkstra', 'dial', 'radix_dijkstra', 'delta_stepping', 'auto_dijkstra')
+
+def load_graph(file_name):
+    """
+    Takes the name of the file containing representation of a directed, weighted
+    graph. Loads graph from a given file. Returns dictionary that models a graph.
+
+    Input format is the following:
+    Each row consists of the node tuples that are adjacent to that particular
+    vertex along with the length of that edge. For example, the 1th row has 1 as
+    the first entry indicating that this row corresponds to the vertex labeled 1.
+    The next entry of this row "2,1" indicates that there is an edge between
+    vertex 1 and vertex 2 that has length 1. The rest of the pairs of this row
+    indicate the other vertices adjacent to vertex 1 and the lengths of the
+    corresponding edges. The file may be compressed with gzip or bz2 (see
+    graph_loader).
+    If the file is a snapshot (see graph_snapshot) the memory-mapped
+    csr_graph.CSRGraph is returned instead, without parsing anything.
+    """
+
+    if is_snapshot(file_name):
+        from . import graph_snapshot
+        return graph_snapshot.load(file_name)
+    return load_adjacency(file_name)
+
+
+def dijkstra(digraph, source= 1, target=None, heuristic=None, queue=None, stats=None):
+    """
+    Takes a weighted, directed graph and a source vertex. Runs Dijkstra's
+    shortest-path algorithm on the input graph, by default using 1 (the first
+    vertex) as the source vertex. Computes the shortest-path distances between
+    the source vertex and every other vertex of the input graph.
+
+    The graph is either a dictionary of dictionaries (see load_graph) or a
+    weighted csr_graph.CSRGraph.
+
+    If target is given the search stops as soon as the target is settled, so
+    only sp_estimate[target] (and the path to it) is guaranteed to be final.
+    If heuristic is given the search is A*: heuristic(vertex) must return a
+    lower bound on the distance from vertex to target that never decreases by
+    more than the length of an edge (a consistent heuristic), and vertices are
+    settled in the order of sp_estimate + heuristic.
+
+    By default the min-priority queue is a heapq list with duplicate entries.
+    Queue may be a function returning a queue with decrease-key instead (for
+    ex. priority_queue.DaryHeap or priority_queue.PairingHeap).
+
+    If stats is given (see instrumentation.Stats) the counts of heap pushes,
+    pops, stale pops (of already settled vertices) and relaxations and the
+    running time are recorded.
+
+    Assumptions:
+    *there's a path from S to every other vertex;
+    *every edge of the graph has a non-negative edge length;
+    """
+    start = time.clock()
+    sp_estimate = {source:0}
+    predecessors = {}
+    # The default heapq list is used directly, without a call wrapping every
+    # heap operation; pop and push are only for the pluggable queues.
+    heap = queue is None
+    heap_push, heap_pop = heappush, heappop
+    if heap:
+        min_priority_queue = [(0,source)]
+    else:
+        min_priority_queue = queue()
+        pop, push = min_priority_queue.pop, min_priority_queue.update
+        push(source, 0)
+    relax_edge = relax
+    if stats is not None:
+        pops_before = stats.counters['heap_pops']
+        if heap:
+            heap_push = stats.counting('heap_pushes', heappush)
+            heap_pop = stats.counting('heap_pops', heappop)
+        else:
+            push, pop = stats.counting('heap_pushes', push), stats.counting('heap_pops', pop)
+        relax_edge = stats.counting('relaxations', relax)
+    # Settled vertices, starting empty so that a query touching a few
+    # vertices doesn't pay for the whole graph.
+    computed = set()
+    adjacent = adjacency(digraph)
+    while min_priority_queue:
+        _, shortest = heap_pop(min_priority_queue) if heap else pop()
+        if shortest in computed:
+            continue
+        computed.add(shortest)
+        if shortest == target:
+            break
+        for adj_vertex, weight in adjacent(shortest):
+            if not relax_edge(digraph, shortest, adj_vertex, sp_estimate, predecessors, weight):
+                continue
+            key = sp_estimate[adj_vertex]
+            if heuristic is not None:
+                key += heuristic(adj_vertex)
+            if heap:
+                heap_push(min_priority_queue, (key, adj_vertex))
+            else:
+                push(adj_vertex, key)
+    if stats is not None:
+        settled = len(computed)
+        stats.count('stale_pops', stats.counters['heap_pops'] - pops_before - settled)
+        stats.timing('dijkstra', time.clock() - start)
+        stats.publish()
+    return sp_estimate, predecessors
+
+
+def bidirectional_dijkstra(digraph, source, target, reversed_digraph=None):
+    """
+    Takes a weighted, directed graph, a source and a target vertex and
+    optionally the graph with all edges reversed (built with reverse_graph if
+    not given). Runs Dijkstra's algorithm forward from the source and backward
+    from the target at once, always advancing the search with the smaller
+    queue, and stops when the sum of both queues' minima reaches the shortest
+    path found so far. Returns the shortest-path distance (inf if the target
+    is unreachable) and the path as a list of vertices.
+    """
+    inf = float('inf')
+    if reversed_digraph is None:
+        reversed_digraph = reverse_graph(digraph)
+    adjacents = (adjacency(digraph), adjacency(reversed_digraph))
+    sp_estimates = ({source: 0}, {target: 0})
+    predecessors = ({}, {})
+    queues = ([(0, source)], [(0, target)])
+    computed = (set(), set())
+    best, meeting = (0, source) if source == target else (inf, None)
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        dist, shortest = heappop(queues[side])
+        if shortest in computed[side]:
+            continue
+        computed[side].add(shortest)
+        sp_estimate, other_estimate = sp_estimates[side], sp_estimates[1 - side]
+        for adj_vertex, weight in adjacents[side](shortest):
+            if dist + weight < sp_estimate.get(adj_vertex, inf):
+                sp_estimate[adj_vertex] = dist + weight
+                predecessors[side][adj_vertex] = shortest
+                heappush(queues[side], (dist + weight, adj_vertex))
+            if adj_vertex in other_estimate:
+                total = sp_estimate[adj_vertex] + other_estimate[adj_vertex]
+                if total < best:
+                    best, meeting = total, adj_vertex
+    if meeting is None:
+        return best, []
+    path = shortest_path(predecessors[0], source, meeting)
+    successors = shortest_path(predecessors[1], target, meeting)
+    return best, path + successors[-2::-1]
+
+
+def reverse_graph(digraph):
+    """
+    Returns the given graph with all edges reversed - a dictionary of
+    dictionaries, or the transpose for CSR graphs.
+    """
+    if hasattr(digraph, 'transpose'):
+        return digraph.transpose()
+    reversed_digraph = dict((vertex, {}) for vertex in digraph)
+    for tail in digraph:
+        for head, weight in digraph[tail].iteritems():
+            reversed_digraph.setdefault(head, {})[tail] = weight
+    return reversed_digraph
+
+
+def shortest_path(predecessors, source, target):
+    """
+    Reconstructs the shortest path from source to target by following
+    predecessors (as returned by dijkstra) back from the target. Returns list
+    of vertices from source to target or an empty list if the target wasn't
+    reached.
+    """
+    if target != source and target not in predecessors:
+        return []
+    path = [target]
+    while target != source:
+        target = predecessors[target]
+        path.append(target)
+    path.reverse()
+    return path
+
+
+def adjacency(digraph):
+    """
+    Returns a function that takes a vertex and returns (head, weight) pairs of
+    the edges leaving it, both for dictionary and CSR graphs.
+    """
+    if hasattr(digraph, 'adjacent'):
+        return digraph.adjacent
+    return lambda vertex: digraph[vertex].iteritems()
+
+
+def relax(digraph, shortest, adj_vertex, sp_estimate, predecessors, weight=None):
+    """
+    Tests whether the shortest path may be improved to adj_vertex by going
+    through shortest, If yes, updates sp_estimate[adj_vertex] and
+    predecessors[adj_vertex]. The length of the edge is looked up in digraph
+    unless it's given as weight. Returns True if the estimate was improved.
+    """
+    inf = float('inf')
+    if weight is None:
+        weight = digraph[shortest][adj_vertex]
+    dist = sp_estimate.get(shortest, inf) + weight # Possible shortcut estimate
+    if dist < sp_estimate.get(adj_vertex, inf):
+        sp_estimate[adj_vertex], predecessors[adj_vertex] = dist, shortest
+        return True
+    return False
+
+
+def main(argv=None):
+    """
+    Prints the shortest-path distances from the source vertex, computed by the
+    chosen engine. The engines of bucket_dijkstra are imported only if chosen.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Computes shortest-path distances.")
+    parser.add_argument('graph_file', nargs='?', default=data_file('dijkstra.txt'),
+                        help="text file (see load_graph) or snapshot")
+    parser.add_argument('--source', type=int, default=1)
+    parser.add_argument('--engine', choices=ENGINES, default='dijkstra')
+    args = parser.parse_args(argv)
+    digraph = load_graph(args.graph_file)
+    if args.engine == 'dijkstra':
+        engine = dijkstra
+    else:
+        from . import bucket_dijkstra
+        engine = getattr(bucket_dijkstra, args.engine)
+    print engine(digraph, args.source)[0]
+
+
+if __name__ == "__main__":
+    main()
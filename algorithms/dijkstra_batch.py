@@ -0,0 +1,114 @@
+"""
+Batched shortest paths from many sources over the same graph. The graph is
+handed to the worker processes once (when the pool is created) and every
+source's distances come back as a flat array of doubles indexed by vertex
+label instead of a pickled dictionary.
+"""
+from array import array
+from heapq import heapify, heappush, heappop
+
+from .dijkstra import adjacency, load_graph
+from .graph_loader import data_file
+
+_digraph = None
+_size = None
+
+
+def graph_size(digraph):
+    """
+    Returns the number of slots needed for arrays indexed by vertex labels of
+    the given graph (the highest label + 1).
+    """
+    if hasattr(digraph, 'offsets'):
+        return len(digraph.offsets) - 1
+    size = max(digraph) + 1 if digraph else 0
+    for adjacent in digraph.itervalues():
+        if adjacent:
+            size = max(size, max(adjacent) + 1)
+    return size
+
+
+def distances(digraph, sources, size=None):
+    """
+    Takes a weighted, directed graph and an iterable of source vertices. Runs
+    Dijkstra's algorithm from a virtual super-source that is connected to
+    every source with an edge of length 0. Returns array of shortest-path
+    distances (inf for unreachable vertices and unused labels) and array of
+    the nearest source of every vertex (-1 if none), both indexed by vertex
+    label.
+    """
+    if size is None:
+        size = graph_size(digraph)
+    inf = float('inf')
+    sp_distance = array('d', [inf]) * size
+    nearest = array('i', [-1]) * size
+    min_priority_queue = []
+    for source in sources:
+        sp_distance[source] = 0
+        nearest[source] = source
+        min_priority_queue.append((0, source))
+    heapify(min_priority_queue)
+    adjacent = adjacency(digraph)
+    while min_priority_queue:
+        dist, shortest = heappop(min_priority_queue)
+        if dist > sp_distance[shortest]:
+            continue
+        for adj_vertex, weight in adjacent(shortest):
+            estimate = dist + weight
+            if estimate < sp_distance[adj_vertex]:
+                sp_distance[adj_vertex] = estimate
+                nearest[adj_vertex] = nearest[shortest]
+                heappush(min_priority_queue, (estimate, adj_vertex))
+    return sp_distance, nearest
+
+
+def nearest_facility(digraph, facilities):
+    """
+    Takes a graph and an iterable of facility vertices. Returns arrays of the
+    distance to the nearest facility and of that facility for every vertex.
+    """
+    return distances(digraph, facilities)
+
+
+def _init_worker(digraph, size):
+    """
+    Pool initializer - keeps the graph in the worker for all its tasks.
+    """
+    global _digraph, _size
+    _digraph, _size = digraph, size
+
+
+def _worker(source):
+    return source, distances(_digraph, (source, ), _size)[0].tostring()
+
+
+def dijkstra_many(digraph, sources, workers=None, chunksize=16):
+    """
+    Takes a graph, an iterable of sources and the number of worker processes
+    (defaults to the number of CPUs). Generates (source, distances) tuples,
+    where distances is an array('d') indexed by vertex label, in the order of
+    sources. With one worker everything runs in the calling process.
+    """
+    from multiprocessing import Pool, cpu_count
+    size = graph_size(digraph)
+    if workers is None:
+        workers = cpu_count()
+    if workers <= 1:
+        for source in sources:
+            yield source, distances(digraph, (source, ), size)[0]
+        return
+    pool = Pool(workers, _init_worker, (digraph, size))
+    try:
+        for source, packed in pool.imap(_worker, sources, chunksize):
+            sp_distance = array('d')
+            sp_distance.fromstring(packed)
+            yield source, sp_distance
+    finally:
+        pool.terminate()
+
+
+if __name__ == "__main__":
+    digraph = load_graph(data_file("dijkstra.txt"))
+    for source, sp_distance in dijkstra_many(digraph, digraph.keys(), workers=2):
+        print source, list(sp_distance[1:])
+    print nearest_facility(digraph, [1, 3])
@@ -0,0 +1,291 @@
+
+"""Disjoint-set data structure
+
+Implementation based on the pseudocode from "Intoduction to Algorithms" by
+T.H. Cormen et al. In this implementation, sets are represented by rooted trees.
+Two heuristics, that is "union by rank" and "path compression", are used to
+for optimization. Runs in time O(m alpha(n)) for m disjoint-set operation on
+n elements.
+
+A disjoint-set data structure maintains a collection S = {S1, S2, S3 ... Sk} of
+disjoint dynamic sets.
+
+Supported operations:
+
+make_set(x)  # creates a new set whose only member (and thus representative) is
+               x -  x must not be in any other set (sets are disjoint)
+union(x, y)  # unites sets that contain x and y (ex. Sx and Sy) into a new set
+               that is a union of these two sets - the representative of the
+               resulting set is any member of Sx U S
+find_set(x)  # returns a pointer to the representative of the (unique) set
+               containing x.
+"""
+
+from collections import Counter
+from array import array
+import sys
+import time
+
+class SetMember():
+    """
+    Models a node with one member in a tree representing one set.
+    """
+    def __init__(self, value):
+        self.value = value
+        self.parent = value
+        self.rank = 0
+
+    def __str__(self):
+        return 'Value: %s Parent: %s Rank: %s' % (self.value, self.parent, self.rank)
+
+
+class DSets(dict):
+    """
+    Implements disjoint-set data structure. Sets are represented as rooted trees
+    with each node containinig one member and each tree representing one set. It's
+    optimized by use of "union-by-rank" and "path compression" heuristics.
+    If stats is given (see instrumentation.Stats) lengths of find paths and
+    the number of unions are recorded.
+    """
+
+    def __init__(self, stats=None):
+        dict.__init__(self)
+        if stats is not None:
+            self.stats = stats
+            self.findset = self.counted_findset
+            self.link = stats.counting('unions', self.link)
+
+
+    def makeset(self, member):
+        """
+        Creates a new tree with just one node with initial rank "0" and pointer
+        to itself as a root.
+        Rank is an upper bound on the height of the node.
+        """
+        self.member = SetMember(member)
+        self[member] = self.member
+
+
+    def findset(self, member):
+        """
+        Finds the root of the tree. The find path is compressed during operation
+        of findset.
+        """
+        if self[member].parent != member:
+            self[member].parent = self.findset(self[member].parent)
+        return self[member].parent
+
+
+    def counted_findset(self, member):
+        """
+        Findset which records the length of the find path. Compresses the
+        path iteratively, which gives the same tree as findset.
+        """
+        path = []
+        while self[member].parent != member:
+            path.append(member)
+            member = self[member].parent
+        for node in path:
+            self[node].parent = member
+        self.stats.observe('findset_path_length', len(path))
+        return member
+
+
+    def link(self, root_x, root_y):
+        """
+        A subroutine called by union. Takes pointers to two roots as inputs.
+        """
+        if self[root_x].rank > self[root_y].rank:
+            self[root_y].parent = self[root_x].parent
+        else:
+            self[root_x].parent = self[root_y].parent
+            if self[root_x].rank ==  self[root_y].rank:
+                self[root_y].rank += 1
+
+
+    def union(self, x, y):
+        """
+        Causes the root of one tree to point to the root of the other. It has
+        two cases depending of whether the roots of the trees have equal rank.If
+        they don't, the root with a higher rank is made the parent of the root
+        with lower rank, but ranks themselver remains unchanged. If they are one
+        root is arbitratly chosen as the parent and its rank is incremented.
+        """
+        self.link(self.findset(x), self.findset(y))
+
+
+    def __str__(self):
+        representation = ''
+        for dset in self.items():
+            representation += '%s: %s' % (dset[0], dset[1]) + '\n'
+        return representation
+
+
+class IntDSets(object):
+    """
+    Implements disjoint-set data structure for dense integer members 0 .. n-1.
+    Parents and ranks are kept in two contiguous arrays instead of one
+    SetMember object per member, so every member costs a few bytes. Findset is
+    iterative and uses "path halving", so long chains never hit the recursion
+    limit. Supports the same makeset/findset/union operations as DSets.
+    If stats is given (see instrumentation.Stats) the numbers of steps of
+    findset and the number of unions that merged two sets are recorded.
+    """
+
+    def __init__(self, size=0, stats=None):
+        self.parent = array('i')
+        # Rank never exceeds lg n, so a signed byte is enough.
+        self.rank = array('b')
+        if size:
+            self.makeset_range(size)
+        if stats is not None:
+            self.stats = stats
+            self.findset = self.counted_findset
+            self.link = stats.counting('unions', self.link)
+
+
+    def __len__(self):
+        return len(self.parent)
+
+
+    def __contains__(self, member):
+        return 0 <= member < len(self.parent)
+
+
+    def makeset(self, member):
+        """
+        Creates a new tree with just one node with initial rank "0" and pointer
+        to itself as a root. Members are dense integers, so creating a member
+        past the current size creates every missing member below it as well.
+        """
+        if member >= len(self.parent):
+            self.makeset_range(member + 1)
+        else:
+            self.parent[member] = member
+            self.rank[member] = 0
+
+
+    def makeset_range(self, size):
+        """
+        Creates singleton sets for all members from the current size up to
+        (but excluding) size in one bulk operation.
+        """
+        start = len(self.parent)
+        if size > start:
+            self.parent.extend(xrange(start, size))
+            self.rank.extend(array('b', [0]) * (size - start))
+
+
+    def findset(self, member):
+        """
+        Finds the root of the tree. The find path is halved during operation
+        of findset - every visited node is pointed to its grandparent.
+        """
+        parent = self.parent
+        while parent[member] != member:
+            parent[member] = parent[parent[member]]
+            member = parent[member]
+        return member
+
+
+    def counted_findset(self, member):
+        """
+        Findset which records the number of steps along the find path.
+        """
+        parent = self.parent
+        steps = 0
+        while parent[member] != member:
+            parent[member] = parent[parent[member]]
+            member = parent[member]
+            steps += 1
+        self.stats.observe('findset_path_length', steps)
+        return member
+
+
+    def link(self, root_x, root_y):
+        """
+        A subroutine called by union. Takes two roots as inputs.
+        """
+        rank = self.rank
+        if rank[root_x] > rank[root_y]:
+            self.parent[root_y] = root_x
+        else:
+            self.parent[root_x] = root_y
+            if rank[root_x] == rank[root_y]:
+                rank[root_y] += 1
+
+
+    def union(self, x, y):
+        """
+        Causes the root of one tree to point to the root of the other (see
+        DSets.union). Returns True if two different sets were united and False
+        if x and y were already in the same set.
+        """
+        root_x, root_y = self.findset(x), self.findset(y)
+        if root_x == root_y:
+            return False
+        self.link(root_x, root_y)
+        return True
+
+
+    def union_many(self, pairs):
+        """
+        Takes an iterable of (x, y) pairs and unites the sets containing each
+        of them. Returns the number of unions that actually merged two sets.
+        """
+        findset, link = self.findset, self.link
+        merged = 0
+        for x, y in pairs:
+            root_x, root_y = findset(x), findset(y)
+            if root_x != root_y:
+                link(root_x, root_y)
+                merged += 1
+        return merged
+
+
+    def find_many(self, members):
+        """
+        Takes an iterable of members and returns an array of their roots.
+        """
+        findset = self.findset
+        return array('i', (findset(member) for member in members))
+
+
+    def __str__(self):
+        representation = ''
+        for member in xrange(len(self.parent)):
+            representation += 'Value: %s Parent: %s Rank: %s' % (
+                member, self.parent[member], self.rank[member]) + '\n'
+        return representation
+
+
+def compare(size=10 ** 5, seed=0):
+    """
+    Compares memory footprint and throughput of DSets and IntDSets on the same
+    random sequence of size unions followed by size findsets.
+    """
+    import random
+    rand = random.Random(seed)
+    pairs = [(rand.randrange(size), rand.randrange(size)) for _ in xrange(size)]
+    for name in ('DSets', 'IntDSets'):
+        start = time.clock()
+        if name == 'DSets':
+            dsets = DSets()
+            for member in xrange(size):
+                dsets.makeset(member)
+            memory = sys.getsizeof(dsets) + sum(
+                sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+                for node in dsets.itervalues())
+        else:
+            dsets = IntDSets(size)
+            memory = sys.getsizeof(dsets.parent) + sys.getsizeof(dsets.rank)
+        for x, y in pairs:
+            dsets.union(x, y)
+        for member in xrange(size):
+            dsets.findset(member)
+        print "%s: %s bytes (%.1f per member), %.3f s" % (
+            name, memory, float(memory) / size, time.clock() - start)
+
+
+if __name__ == "__main__":
+    compare()
@@ -0,0 +1,109 @@
+"""
+Incremental update of single-source shortest paths after a batch of edge
+changes, in the style of the Ramalingam-Reps algorithm. Only the vertices
+whose shortest paths changed (and their neighbours) are touched, instead of
+rerunning dijkstra.dijkstra on the whole graph.
+"""
+from heapq import heappush, heappop
+
+from .dijkstra import dijkstra, load_graph, reverse_graph
+from .graph_loader import data_file
+
+
+def update(digraph, source, shortest_paths, changes, reversed_digraph=None):
+    """
+    Takes a graph modeled as a dictionary of dictionaries, the source vertex,
+    the (sp_estimate, predecessors) tuple computed for it by dijkstra, and an
+    iterable of changes as (tail, head, weight) tuples - edge insertions or
+    new lengths of existing edges. Applies the changes to the graph (and to
+    reversed_digraph) and updates sp_estimate and predecessors in place.
+    Returns the updated tuple.
+
+    When some shortest path gets longer, the in-edges of the affected vertices
+    are needed - pass reversed_digraph (see dijkstra.reverse_graph) and keep
+    it for the next updates, otherwise it's rebuilt from the whole graph.
+    """
+    inf = float('inf')
+    sp_estimate, predecessors = shortest_paths
+    increased, decreased = [], []
+    # Only the last change of each edge counts.
+    new_weights = {}
+    for tail, head, weight in changes:
+        new_weights[tail, head] = weight
+    for (tail, head), weight in new_weights.iteritems():
+        old_weight = digraph.get(tail, {}).get(head)
+        if hasattr(digraph, 'add_edge'):
+            digraph.add_edge(tail, head, weight)
+        else:
+            digraph.setdefault(tail, {})[head] = weight
+            digraph.setdefault(head, {})
+        if reversed_digraph is not None:
+            reversed_digraph.setdefault(head, {})[tail] = weight
+            reversed_digraph.setdefault(tail, {})
+        if old_weight is not None and weight > old_weight:
+            if predecessors.get(head) == tail:
+                increased.append(head)
+        elif old_weight is None or weight < old_weight:
+            decreased.append((tail, head, weight))
+
+    min_priority_queue = []
+    if increased:
+        if reversed_digraph is None:
+            reversed_digraph = reverse_graph(digraph)
+        affected = affected_subtree(digraph, predecessors, increased)
+        for vertex in affected:
+            del sp_estimate[vertex]
+            del predecessors[vertex]
+        # Each affected vertex gets its best estimate through the vertices
+        # whose shortest paths didn't change.
+        for vertex in affected:
+            for tail, weight in reversed_digraph[vertex].iteritems():
+                if tail in affected or tail not in sp_estimate:
+                    continue
+                dist = sp_estimate[tail] + weight
+                if dist < sp_estimate.get(vertex, inf):
+                    sp_estimate[vertex], predecessors[vertex] = dist, tail
+            if vertex in sp_estimate:
+                heappush(min_priority_queue, (sp_estimate[vertex], vertex))
+
+    for tail, head, weight in decreased:
+        if tail not in sp_estimate or head == source:
+            continue
+        dist = sp_estimate[tail] + weight
+        if dist < sp_estimate.get(head, inf):
+            sp_estimate[head], predecessors[head] = dist, tail
+            heappush(min_priority_queue, (dist, head))
+
+    while min_priority_queue:
+        dist, shortest = heappop(min_priority_queue)
+        if dist > sp_estimate[shortest]:
+            continue
+        for adj_vertex, weight in digraph[shortest].iteritems():
+            if dist + weight < sp_estimate.get(adj_vertex, inf):
+                sp_estimate[adj_vertex] = dist + weight
+                predecessors[adj_vertex] = shortest
+                heappush(min_priority_queue, (dist + weight, adj_vertex))
+    return sp_estimate, predecessors
+
+
+def affected_subtree(digraph, predecessors, roots):
+    """
+    Returns set of vertices in the subtrees of the shortest-path tree rooted
+    at the given vertices. Tree edges are graph edges, so the subtree is found
+    by following out-edges (u, v) with predecessors[v] == u.
+    """
+    affected = set(roots)
+    stack = list(affected)
+    while stack:
+        vertex = stack.pop()
+        for adj_vertex in digraph[vertex]:
+            if adj_vertex not in affected and predecessors.get(adj_vertex) == vertex:
+                affected.add(adj_vertex)
+                stack.append(adj_vertex)
+    return affected
+
+
+if __name__ == "__main__":
+    digraph = load_graph(data_file("dijkstra.txt"))
+    shortest_paths = dijkstra(digraph, 1)
+    print update(digraph, 1, shortest_paths, [(1, 2, 5), (3, 4, 1)])[0]
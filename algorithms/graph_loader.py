@@ -0,0 +1,137 @@
+"""
+Bulk loaders of the graph files used in this repository.
+
+Files are read in large blocks cut at line ends and every block is tokenized
+at once - with numpy.fromstring if NumPy is available, otherwise with a single
+split of the whole block - instead of splitting and converting line by line.
+Files compressed with gzip or bz2 (recognized by their first bytes, whatever
+the name) are decompressed on the fly.
+
+read_columns    # rows of numbers ("tail head" or "tail head weight") into
+                  one typed array per column
+load_adjacency  # rows "vertex head,length head,length ..." (dijkstra.txt)
+                  into a dictionary of dictionaries
+
+The graphs themselves are built from the column arrays in one pass (see
+csr_graph.CSRGraph.from_file and the load functions of the algorithms).
+
+is_snapshot     # whether a file is a binary snapshot (see graph_snapshot)
+                  rather than text
+data_file       # path of a sample input shipped in the data directory
+"""
+from array import array
+from itertools import izip
+import os
+
+from .optional import optional_import
+
+BLOCK_SIZE = 1 << 22
+SNAPSHOT_MAGIC = 'CSRGRAPH' # First bytes of graph_snapshot files.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def data_file(file_name):
+    """
+    Returns path of the sample input file_name (for ex. 'dijkstra.txt').
+    """
+    return os.path.join(DATA_DIR, file_name)
+
+
+def is_snapshot(file_name):
+    """
+    Tests whether the file is a graph snapshot (by its first bytes), so that
+    graph_snapshot needs to be imported only to load one.
+    """
+    with open(file_name, 'rb') as opened:
+        return opened.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+
+
+def open_input(file_name):
+    """
+    Opens file for reading in binary mode, decompressing gzip and bz2 files.
+    """
+    with open(file_name, 'rb') as opened:
+        magic = opened.read(3)
+    if magic[:2] == '\x1f\x8b':
+        import gzip
+        return gzip.open(file_name, 'rb')
+    if magic == 'BZh':
+        import bz2
+        return bz2.BZ2File(file_name, 'rb')
+    return open(file_name, 'rb')
+
+
+def read_blocks(file_name, block_size=BLOCK_SIZE):
+    """
+    Generates the contents of the file in blocks of about block_size bytes,
+    every block (except possibly the last one) ending with a whole line.
+    """
+    opened = open_input(file_name)
+    try:
+        rest = ''
+        while True:
+            block = opened.read(block_size)
+            if not block:
+                break
+            end = block.rfind('\n') + 1
+            if end == 0:
+                rest += block
+                continue
+            yield rest + block[:end]
+            rest = block[end:]
+        if rest:
+            yield rest
+    finally:
+        opened.close()
+
+
+def read_columns(file_name, typecodes, block_size=BLOCK_SIZE):
+    """
+    Reads a file in which every row has len(typecodes) whitespace separated
+    numbers. Returns list of arrays, one per column, of the given typecodes
+    (for ex. 'iil' for "tail head weight" rows). A shorter first row - the
+    "[number_of_nodes] [number_of_edges]" header of the Kruskal's and Prim's
+    inputs - is skipped. Raises ValueError if rows have other lengths.
+    """
+    columns = len(typecodes)
+    arrays = [array(typecode) for typecode in typecodes]
+    converters = [float if typecode in 'fd' else int for typecode in typecodes]
+    numpy = optional_import('numpy')
+    dtype = None
+    if numpy is not None:
+        dtype = numpy.float64 if float in converters else numpy.int64
+    first = True
+    for block in read_blocks(file_name, block_size):
+        if first:
+            first = False
+            end = block.find('\n') + 1 or len(block)
+            if len(block[:end].split()) < columns:
+                block = block[end:]
+        if dtype is not None:
+            values = numpy.fromstring(block, dtype=dtype, sep=' ')
+        else:
+            values = block.split()
+        if len(values) % columns:
+            raise ValueError("Rows of %s don't have %s numbers" % (file_name, columns))
+        for column, (values_array, convert) in enumerate(izip(arrays, converters)):
+            if dtype is not None:
+                part = values[column::columns].astype(values_array.typecode)
+                values_array.fromstring(part.tostring())
+            else:
+                values_array.extend(map(convert, values[column::columns]))
+    return arrays
+
+
+def load_adjacency(file_name, block_size=BLOCK_SIZE):
+    """
+    Loads a file in which every row is a vertex followed by "head,length"
+    pairs of the edges leaving it (see dijkstra.load_graph). Returns
+    dictionary of dictionaries {tail: {head: length}}.
+    """
+    graph = {}
+    for block in read_blocks(file_name, block_size):
+        for line in block.replace(',', ' ').splitlines():
+            values = map(int, line.split())
+            if values:
+                graph[values[0]] = dict(izip(values[1::2], values[2::2]))
+    return graph
@@ -0,0 +1,188 @@
+"""
+Binary snapshots of graphs in CSR format (see csr_graph), loaded with mmap.
+
+A graph is parsed from its text file once and saved; loading the snapshot
+maps the file into memory and wraps its sections with ctypes arrays, so the
+adjacency is read straight from the mapped pages - nothing is parsed or
+copied and loading takes the same time whatever the size of the graph. Pages
+are mapped copy-on-write, the file itself is never modified.
+
+File layout (native byte order, sections aligned to 8 bytes):
+header            # HEADER fields, padded to DATA_OFFSET bytes
+offsets           # size + 1 integers of offset_size bytes
+targets           # edges_num integers of target_size bytes
+weights           # edges_num numbers of weight_size bytes (if weighted)
+transpose         # offsets, targets and weights of the graph with all edges
+                    reversed (if saved with transpose=True)
+
+Flags of the header tell whether the graph is weighted, whether the transpose
+is stored and whether the graph is symmetric (an undirected graph with every
+edge stored in both directions).
+
+Usage: graph-snapshot [--format edges|weighted|undirected|adjacency]
+       [--transpose] text_file snapshot_file
+"""
+from array import array
+import ctypes
+import mmap
+import struct
+
+from .csr_graph import CSRGraph
+from .graph_loader import SNAPSHOT_MAGIC as MAGIC, load_adjacency
+
+VERSION = 1
+BYTE_ORDER = 0x01020304
+# magic, version, byte order marker, flags, first, size (labels below size),
+# edges_num, offset_size, target_size, weight kind ('i', 'f' or '-'), weight_size
+HEADER = struct.Struct('=8sHIHiqqBBcB')
+DATA_OFFSET = 64
+WEIGHTED, TRANSPOSED, SYMMETRIC = 1, 2, 4
+
+INTEGER_TYPES = {1: ctypes.c_int8, 2: ctypes.c_int16, 4: ctypes.c_int32, 8: ctypes.c_int64}
+FLOAT_TYPES = {4: ctypes.c_float, 8: ctypes.c_double}
+FORMATS = ('edges', 'weighted', 'undirected', 'adjacency')
+
+
+def typecode_of(kind, size):
+    """
+    Returns typecode of the array module for numbers of the given kind ('i' or
+    'f') and size in bytes.
+    """
+    for typecode in ('bhil' if kind == 'i' else 'fd'):
+        if array(typecode).itemsize == size:
+            return typecode
+    raise ValueError("No array type for %s-byte %s numbers" % (size, 'integer' if kind == 'i' else 'float'))
+
+
+def write_section(opened, values):
+    """
+    Writes an array (array.array or ctypes array) and pads the file to a
+    multiple of 8 bytes.
+    """
+    opened.write(buffer(values))
+    opened.write('\0' * (-opened.tell() % 8))
+
+
+def save(graph, file_name, transpose=False, symmetric=False):
+    """
+    Saves a csr_graph.CSRGraph to a snapshot file. If transpose is True the
+    transpose is computed and stored as well. Symmetric marks an undirected
+    graph with every edge stored in both directions (see
+    CSRGraph.from_file).
+    """
+    weights = graph.weights
+    flags = (WEIGHTED if weights is not None else 0) | (TRANSPOSED if transpose else 0)
+    flags |= SYMMETRIC if symmetric else 0
+    weight_kind, weight_size = '-', 0
+    if weights is not None:
+        weight_kind = 'f' if weights.typecode in 'fd' else 'i'
+        weight_size = array(weights.typecode).itemsize
+    graphs = [graph, graph.transpose()] if transpose else [graph]
+    with open(file_name, 'wb') as opened:
+        opened.write(HEADER.pack(MAGIC, VERSION, BYTE_ORDER, flags, graph.first,
+                                 len(graph.offsets) - 1, len(graph.targets),
+                                 array(graph.offsets.typecode).itemsize,
+                                 array(graph.targets.typecode).itemsize,
+                                 weight_kind, weight_size))
+        opened.write('\0' * (DATA_OFFSET - HEADER.size))
+        for part in graphs:
+            write_section(opened, part.offsets)
+            write_section(opened, part.targets)
+            if weights is not None:
+                write_section(opened, part.weights)
+
+
+def load(file_name):
+    """
+    Maps a snapshot file into memory. Returns csr_graph.CSRGraph whose arrays
+    are ctypes arrays over the mapped pages. If the transpose was stored,
+    the transpose method of the graph returns it instead of computing it.
+    The graph also gets a symmetric attribute (see save).
+    """
+    with open(file_name, 'rb') as opened:
+        mapped = mmap.mmap(opened.fileno(), 0, access=mmap.ACCESS_COPY)
+    (magic, version, byte_order, flags, first, size, edges_num, offset_size,
+     target_size, weight_kind, weight_size) = HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        raise ValueError("%s is not a graph snapshot" % file_name)
+    if version != VERSION:
+        raise ValueError("%s has snapshot version %s, %s is supported" % (file_name, version, VERSION))
+    if byte_order != BYTE_ORDER:
+        raise ValueError("%s was saved on a machine with another byte order" % file_name)
+    position = [DATA_OFFSET]
+
+    def section(ctype, count, typecode):
+        values = (ctype * count).from_buffer(mapped, position[0])
+        values.typecode = typecode # Read by code that expects array.array.
+        position[0] += ctypes.sizeof(values)
+        position[0] += -position[0] % 8
+        return values
+
+    def read_graph():
+        offsets = section(INTEGER_TYPES[offset_size], size + 1, typecode_of('i', offset_size))
+        targets = section(INTEGER_TYPES[target_size], edges_num, typecode_of('i', target_size))
+        weights = None
+        if flags & WEIGHTED:
+            types = FLOAT_TYPES if weight_kind == 'f' else INTEGER_TYPES
+            weights = section(types[weight_size], edges_num, typecode_of(weight_kind, weight_size))
+        return CSRGraph(offsets, targets, weights, first)
+
+    graph = read_graph()
+    graph.symmetric = bool(flags & SYMMETRIC)
+    if flags & TRANSPOSED:
+        reversed_graph = read_graph()
+        reversed_graph.symmetric = graph.symmetric
+        graph.transpose = lambda: reversed_graph
+        reversed_graph.transpose = lambda: graph
+    return graph
+
+
+def edge_list(graph):
+    """
+    Returns list of (tail, head, weight) tuples of a weighted CSR graph (see
+    kruskal_mst.load_graph). Edges of a symmetric graph are listed once.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    symmetric = getattr(graph, 'symmetric', False)
+    edges = []
+    for tail in xrange(len(offsets) - 1):
+        for index in xrange(offsets[tail], offsets[tail + 1]):
+            head = targets[index]
+            if not symmetric or tail < head:
+                edges.append((tail, head, weights[index]))
+    return edges
+
+
+def convert(text_file, snapshot_file, format='edges', transpose=False):
+    """
+    Parses a text graph file and saves it as a snapshot. Format is one of:
+    edges       # "tail head" rows (scc.loadgraph)
+    weighted    # "tail head weight" rows, directed
+    undirected  # "tail head weight" rows of an undirected graph
+                  (kruskal_mst.load_graph, prims_mst.load_graph)
+    adjacency   # "vertex head,length ..." rows (dijkstra.load_graph)
+    """
+    if format == 'edges':
+        graph = CSRGraph.from_file(text_file)
+    elif format in ('weighted', 'undirected'):
+        graph = CSRGraph.from_file(text_file, weighted=True, symmetric=format == 'undirected')
+    elif format == 'adjacency':
+        graph = CSRGraph.from_adjacency(load_adjacency(text_file))
+    else:
+        raise ValueError("Unknown format %r" % (format, ))
+    save(graph, snapshot_file, transpose, format == 'undirected')
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Saves a text graph file as a binary snapshot.")
+    parser.add_argument('--format', choices=FORMATS, default='edges')
+    parser.add_argument('--transpose', action='store_true', help="stores the transpose as well")
+    parser.add_argument('text_file')
+    parser.add_argument('snapshot_file')
+    args = parser.parse_args(argv)
+    convert(args.text_file, args.snapshot_file, args.format, args.transpose)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Opt-in instrumentation of the algorithms of this repository.
+
+Algorithms take an optional stats argument (None by default). Without it they
+run exactly as before - hooks are installed by swapping functions once per
+call (for ex. a counting push instead of heappush), not by checks inside hot
+loops - and print nothing. With a Stats object they record:
+
+counters    # totals (heap_pushes, heap_pops, stale_pops, relaxations, unions,
+              swaps, partitions, ...)
+histograms  # how many times each value was observed (findset_path_length,
+              partition_depth)
+maxima      # high-water marks (dfs_stack)
+timings     # seconds spent in phases of an algorithm
+
+Stats are read with as_dict or passed to a callback, which algorithms call
+through publish when they finish. Algorithms don't import this module, any
+object with the same methods may be passed instead.
+"""
+from collections import Counter, defaultdict
+
+
+class Stats(object):
+    """
+    Collects counters, histograms, high-water marks and timings. Callback,
+    if given, is called with as_dict() every time an algorithm publishes its
+    stats.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.reset()
+
+
+    def reset(self):
+        self.counters = Counter()
+        self.histograms = defaultdict(Counter)
+        self.maxima = {}
+        self.timings = Counter()
+
+
+    def count(self, name, amount=1):
+        self.counters[name] += amount
+
+
+    def observe(self, name, value):
+        """
+        Adds one observation of value to the histogram name.
+        """
+        self.histograms[name][value] += 1
+
+
+    def high_water(self, name, value):
+        if value > self.maxima.get(name, value - 1):
+            self.maxima[name] = value
+
+
+    def timing(self, name, seconds):
+        self.timings[name] += seconds
+
+
+    def counting(self, name, function):
+        """
+        Returns function wrapped so that every call is counted as name.
+        """
+        counters = self.counters
+        def counted(*args):
+            counters[name] += 1
+            return function(*args)
+        return counted
+
+
+    def stack_type(self, name, base=list):
+        """
+        Returns a subclass of base (list or collections.deque) whose append
+        and extend record the high-water mark of its length as name.
+        """
+        high_water = self.high_water
+
+        class Tracked(base):
+            def append(self, item):
+                base.append(self, item)
+                high_water(name, len(self))
+
+            def extend(self, items):
+                base.extend(self, items)
+                high_water(name, len(self))
+
+        return Tracked
+
+
+    def as_dict(self):
+        return {'counters': dict(self.counters),
+                'histograms': dict((name, dict(histogram))
+                                   for name, histogram in self.histograms.iteritems()),
+                'maxima': dict(self.maxima),
+                'timings': dict(self.timings)}
+
+
+    def publish(self):
+        """
+        Called by algorithms when they finish. Passes stats to the callback.
+        """
+        if self.callback is not None:
+            self.callback(self.as_dict())
+
+
+    def __str__(self):
+        lines = ['%s: %s' % item for item in sorted(self.counters.iteritems())]
+        lines.extend('%s (max): %s' % item for item in sorted(self.maxima.iteritems()))
+        lines.extend('%s: %.6f s' % item for item in sorted(self.timings.iteritems()))
+        for name, histogram in sorted(self.histograms.iteritems()):
+            lines.append('%s: %s' % (name, ' '.join('%s:%s' % item
+                                                    for item in sorted(histogram.iteritems()))))
+        return '\n'.join(lines)
@@ -0,0 +1,92 @@
+"""
+Python implementation of two generalizations of the activity selection problem
+(see activity_selection_iter.py). Activities are tuples (start, finish) and two
+activities are compatible if one starts no earlier than the other finishes.
+
+Weighted interval scheduling: every activity has a weight, the goal is to
+select a set of mutually compatible activities with the maximum total weight.
+Solved iteratively by dynamic programming over activities sorted by finish
+time (ties by start time), with binary search for the last compatible
+activity. Runs in O(n lg n).
+
+Interval partitioning: the goal is to schedule all activities using the
+minimum number of resources, so that activities on each resource are mutually
+compatible. Solved greedily by processing activities in order of start time
+(ties by finish time) and keeping resources in a min-heap by the finish time
+of their last activity. Runs in O(n lg n).
+"""
+from bisect import bisect_right
+from heapq import heappush, heapreplace
+
+
+def select_weighted(tasks, weights):
+    """
+    Takes a list of tasks as tuples (start, finish) and a sequence of their
+    weights. Returns the maximum total weight of mutually compatible tasks and
+    the list of these tasks ordered by finish time.
+    """
+    order = sorted(xrange(len(tasks)), key=lambda index: (tasks[index][1], tasks[index][0]))
+    finishes = [tasks[index][1] for index in order]
+    # best[j] is the maximum weight using the first j tasks in finish order,
+    # compatible[j] the number of tasks that finish before task j starts.
+    best = [0] * (len(order) + 1)
+    compatible = [0] * len(order)
+    for position, index in enumerate(order):
+        compatible[position] = bisect_right(finishes, tasks[index][0], 0, position)
+        best[position + 1] = max(best[position],
+                                 best[compatible[position]] + weights[index])
+    selected = []
+    position = len(order)
+    while position > 0:
+        if best[position] == best[position - 1]:
+            position -= 1
+        else:
+            selected.append(tasks[order[position - 1]])
+            position = compatible[position - 1]
+    selected.reverse()
+    return best[-1], selected
+
+
+def partition_intervals(tasks):
+    """
+    Takes a list of tasks as tuples (start, finish). Assigns every task to a
+    resource so that tasks on each resource are mutually compatible, using
+    the minimum number of resources. Returns the number of resources and the
+    list of resource numbers (from 0) of the tasks, in the input order.
+    """
+    order = sorted(xrange(len(tasks)), key=lambda index: tasks[index])
+    resources = [None] * len(tasks)
+    in_use = [] # Heap of (finish of the last task, resource number).
+    for index in order:
+        start, finish = tasks[index]
+        if in_use and in_use[0][0] <= start:
+            resource = in_use[0][1]
+            heapreplace(in_use, (finish, resource))
+        else:
+            resource = len(in_use)
+            heappush(in_use, (finish, resource))
+        resources[index] = resource
+    return len(in_use), resources
+
+
+def main(argv=None):
+    """
+    Prints the maximum-weight set of compatible activities and the partition
+    of all activities into the minimum number of resources, for activities
+    from a file (or the sample activities).
+    """
+    from .cli import load_tasks, tasks_parser
+    parser = tasks_parser("Solves weighted interval scheduling and interval partitioning.")
+    parser.add_argument('--weighted', action='store_true',
+                        help="rows of the file are \"start finish weight\" (the sample is weighted)")
+    args = parser.parse_args(argv)
+    if args.weighted or args.tasks_file is None:
+        tasks, weights = load_tasks(args, weighted=True)
+        print select_weighted(tasks, weights)
+    else:
+        tasks = load_tasks(args)
+    print partition_intervals(tasks)
+
+
+if __name__ == "__main__":
+    main()
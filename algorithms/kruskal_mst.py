@@ -0,0 +1,244 @@
+"""
+Python 2.7 implementation of Kruskal's algorithm for finding minimum spanning tree
+of a graph. It uses the disjoint-set data structure implemented as the
+disjoint-set-forest imlemenation with the union-by-rank and path compression
+heuristics.
+It also contains streaming version of the algorithm for edge files larger than
+memory: edges are sorted in bounded chunks written to temporary files and the
+sorted runs are merged lazily, at most MERGE_FAN_IN at a time.
+"""
+
+from .disjoint import IntDSets
+from array import array
+from heapq import merge
+
+from .graph_loader import data_file, is_snapshot, open_input, read_blocks, read_columns
+
+# Engines selectable from the command line (see main), boruvka and
+# filter_kruskal from parallel_mst.
+ENGINES = ('kruskal', 'streaming', 'boruvka', 'filter_kruskal')
+# Number of sorted runs open and merged at once by kruskal_streaming (each
+# with a read buffer of block_size integers, see read_run).
+MERGE_FAN_IN = 16
+
+def load_graph(inp):
+    """
+    Takes name of the file containing representation of a undirected, weighted
+    graph. Loads graph from a given file. Returns a list that models a graph.
+    The graph contains each edge and its weight.
+
+    Input format: This file describes an undirected graph with integer edge costs.
+    It has the following format:
+    [number_of_nodes] [number_of_edges]
+    [one_node_of_edge_1] [other_node_of_edge_1] [edge_1_cost]
+    [one_node_of_edge_2] [other_node_of_edge_2] [edge_2_cost]
+    For example, the third line of the file is "2 3 -8874", indicating that
+    there is an edge connecting vertex #2 and vertex #3 that has cost -8874.
+    The edge costs may be positive or negative and do not have to be distinct.
+    The file is parsed in bulk and may be compressed (see graph_loader). It
+    may also be a snapshot (see graph_snapshot), whose edges are listed
+    without parsing.
+    """
+
+    if is_snapshot(inp):
+        from . import graph_snapshot
+        return graph_snapshot.edge_list(graph_snapshot.load(inp))
+    return zip(*read_columns(inp, 'iil'))
+
+def kruskal(unsorted_graph, vertices_num=None, argsort=None, stats=None):
+    """
+    Takes unsorted graph and optionally the number of vertices (vertices are
+    labeled with integers below vertices_num; by default it's the highest
+    label + 1). Performs Kruskal's algorithm for finding minimum spanning tree.
+    Returns list of tuples forming minimum spanning tree. Each tuple contains an
+    edge with corresponding costs of adding it to the tree.
+    By default edges are sorted with sorted(). If argsort is given (for ex.
+    radix_sort.argsort, which sorts integer costs in linear time) it's called
+    with an array of costs and edges are visited in the order of the returned
+    indices, without making a sorted copy of the graph.
+    If stats is given (see instrumentation.Stats) the disjoint sets record
+    lengths of find paths and the number of unions.
+    """
+
+    MST = []
+    if vertices_num is None:
+        vertices_num = 0
+        if unsorted_graph:
+            vertices_num = max(max(edge[0], edge[1]) for edge in unsorted_graph) + 1
+    if argsort is None:
+        graph = sorted(unsorted_graph, key=lambda weight: weight[2])
+    else:
+        order = argsort(array('l', (edge[2] for edge in unsorted_graph)))
+        graph = (unsorted_graph[index] for index in order)
+    diset = IntDSets(vertices_num, stats)
+    for edge in graph:
+        if diset.union(edge[0], edge[1]):
+            MST.append(edge)
+    if stats is not None:
+        stats.publish()
+    return MST
+
+def read_header(inp):
+    """
+    Returns ([number_of_nodes], [number_of_edges]) from the first line of the
+    input file (which may be compressed, see graph_loader.open_input).
+    """
+    opened = open_input(inp)
+    try:
+        line = opened.readline().split()
+    finally:
+        opened.close()
+    return int(line[0]), int(line[1])
+
+def sorted_runs(inp, chunk_size=10 ** 6):
+    """
+    Reads edges from the input file (see load_graph) in chunks of chunk_size
+    edges. Sorts every chunk by cost and writes it to an anonymous temporary
+    file as an array of (cost, node, node) triples. Returns list of the files.
+    The file is read in blocks by graph_loader.read_blocks, so it may be
+    compressed.
+    """
+    runs = []
+    chunk = []
+    first = True
+    for block in read_blocks(inp):
+        if first:
+            first = False
+            end = block.find('\n') + 1 or len(block)
+            if len(block[:end].split()) < 3:
+                block = block[end:] # The header.
+        values = map(int, block.split())
+        if len(values) % 3:
+            raise ValueError("Rows of %s don't have 3 numbers" % (inp, ))
+        for index in xrange(0, len(values), 3):
+            chunk.append((values[index + 2], values[index], values[index + 1]))
+            if len(chunk) == chunk_size:
+                runs.append(write_run(chunk))
+                chunk = []
+    if chunk:
+        runs.append(write_run(chunk))
+    return runs
+
+def write_run(chunk):
+    import tempfile
+    chunk.sort()
+    run = tempfile.TemporaryFile()
+    triples = array('l')
+    for edge in chunk:
+        triples.extend(edge)
+    triples.tofile(run)
+    run.seek(0)
+    return run
+
+def read_run(run, block_size=3 * 8192):
+    """
+    Generates (cost, node, node) triples from a file written by write_run,
+    reading it in blocks of block_size integers.
+    """
+    while True:
+        block = array('l')
+        try:
+            block.fromfile(run, block_size)
+        except EOFError:
+            pass # The items that were available are in block anyway.
+        for index in xrange(0, len(block), 3):
+            yield block[index], block[index + 1], block[index + 2]
+        if len(block) < block_size:
+            return
+
+def merge_runs(runs, fan_in=MERGE_FAN_IN, block_size=3 * 8192):
+    """
+    Merges sorted runs (see write_run) in passes, fan_in runs at a time into
+    one longer run, until at most fan_in runs are left. Merged runs are
+    closed. Returns list of the remaining runs.
+    """
+    import tempfile
+    while len(runs) > fan_in:
+        merged = []
+        for beginning in xrange(0, len(runs), fan_in):
+            group = runs[beginning:beginning + fan_in]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            run = tempfile.TemporaryFile()
+            try:
+                block = array('l')
+                for edge in merge(*[read_run(member) for member in group]):
+                    block.extend(edge)
+                    if len(block) >= block_size:
+                        block.tofile(run)
+                        block = array('l')
+                block.tofile(run)
+            finally:
+                for member in group:
+                    member.close()
+            run.seek(0)
+            merged.append(run)
+        runs = merged
+    return runs
+
+def kruskal_streaming(inp, chunk_size=10 ** 6, vertices_num=None, fan_in=MERGE_FAN_IN):
+    """
+    Takes name of the file containing representation of a graph (see
+    load_graph). Performs Kruskal's algorithm in O(V + chunk_size + fan_in *
+    block) memory (block being the read buffer of a run, see read_run): sorts
+    edges in chunks (see sorted_runs), merges the sorted runs in passes until
+    at most fan_in are left (see merge_runs), k-way merges those and stops as
+    soon as V - 1 edges are accepted. The number of vertices is taken from
+    the header of the file unless it's given. Returns list of tuples forming
+    minimum spanning tree just like kruskal.
+    """
+    if vertices_num is None:
+        vertices_num = read_header(inp)[0]
+    runs = sorted_runs(inp, chunk_size)
+    MST = []
+    try:
+        runs = merge_runs(runs, fan_in)
+        diset = IntDSets(vertices_num + 1)
+        for weight, tail, head in merge(*[read_run(run) for run in runs]):
+            if len(MST) >= vertices_num - 1:
+                break
+            if diset.union(tail, head):
+                MST.append((tail, head, weight))
+    finally:
+        for run in runs:
+            run.close()
+    return MST
+
+def overall_cost(mst):
+    """
+    Calculates the overall cost of a minimum spanning tree: an integer, which
+    may or may not be negative.
+    """
+    return sum(weight for _, _, weight in mst)
+
+
+def main(argv=None):
+    """
+    Prints the cost of the minimum spanning tree found by the chosen engine.
+    The engines of parallel_mst are imported only if chosen.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Computes minimum spanning tree with Kruskal's algorithm.")
+    parser.add_argument('graph_file', nargs='?', default=data_file('kruskal_mst.txt'),
+                        help="text file (see load_graph) or snapshot (except for streaming)")
+    parser.add_argument('--engine', choices=ENGINES, default='kruskal')
+    parser.add_argument('--chunk-size', type=int, default=10 ** 6,
+                        help="edges sorted in memory at once by the streaming engine")
+    parser.add_argument('--fan-in', type=int, default=MERGE_FAN_IN,
+                        help="sorted runs merged at once by the streaming engine")
+    args = parser.parse_args(argv)
+    if args.engine == 'streaming':
+        mst = kruskal_streaming(args.graph_file, args.chunk_size, fan_in=args.fan_in)
+    else:
+        if args.engine == 'kruskal':
+            engine = kruskal
+        else:
+            from . import parallel_mst
+            engine = getattr(parallel_mst, args.engine)
+        mst = engine(load_graph(args.graph_file))
+    print overall_cost(mst) # Should return -3612829 for kruskal_mst.txt.
+
+
+if __name__ == "__main__":
+    main()
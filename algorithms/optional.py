@@ -0,0 +1,38 @@
+"""
+Optional dependencies, imported on first use instead of at import time.
+
+NumPy speeds up loading and building graphs and batch activity selection,
+but importing it takes longer than importing all the algorithms together, so
+modules call optional_import('numpy') where they need it and fall back to
+pure Python if it returns None.
+
+disable(name) makes optional_import return None for name, for ex. to compare
+results and timings without NumPy.
+"""
+import importlib
+
+_modules = {}
+
+
+def optional_import(name):
+    """
+    Returns module name, imported on the first call, or None if it isn't
+    installed (or was disabled).
+    """
+    if name not in _modules:
+        try:
+            _modules[name] = importlib.import_module(name)
+        except ImportError:
+            _modules[name] = None
+    return _modules[name]
+
+
+def disable(name):
+    _modules[name] = None
+
+
+def enable(name):
+    """
+    Undoes disable: name is imported again on the next optional_import.
+    """
+    _modules.pop(name, None)
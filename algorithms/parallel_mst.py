@@ -0,0 +1,214 @@
+"""
+Python 2.7 implementation of Boruvka's and Filter-Kruskal algorithms for
+finding minimum spanning tree of a graph, as alternatives to kruskal_mst.kruskal.
+Both take the same list of (node, node, cost) edges and return the same list of
+tuples forming minimum spanning tree (or forest if the graph is disconnected).
+
+Boruvka's algorithm works in rounds: each component finds its cheapest outgoing
+edge and all these edges are added at once. The search is split into edge
+partitions handled by a pool of processes. Edges are handed to the workers once
+and components of vertices are shared with them through shared memory.
+Filter-Kruskal partitions edges around a random pivot cost and drops edges
+inside already connected components before sorting them.
+"""
+
+from .disjoint import IntDSets
+from .kruskal_mst import kruskal, load_graph, overall_cost
+from array import array
+import random
+import sys
+import time
+
+_tails = _heads = _weights = _component = None
+
+
+def _init_worker(tails, heads, weights, component):
+    global _tails, _heads, _weights, _component
+    _tails, _heads, _weights, _component = tails, heads, weights, component
+
+
+def _cheapest(bounds):
+    """
+    Finds the cheapest edge leaving every component among edges with indices
+    from bounds[0] to bounds[1]. Ties are broken by edge index, so all
+    partitions agree on a single order of edges. Returns dictionary
+    {component: (cost, edge_index)}.
+    """
+    component = _component # Read in place, not copied for every partition.
+    tails, heads, weights = _tails, _heads, _weights
+    cheapest = {}
+    for index in xrange(bounds[0], bounds[1]):
+        tail_component, head_component = component[tails[index]], component[heads[index]]
+        if tail_component == head_component:
+            continue
+        key = (weights[index], index)
+        for leader in (tail_component, head_component):
+            best = cheapest.get(leader)
+            if best is None or key < best:
+                cheapest[leader] = key
+    return cheapest
+
+
+def boruvka(graph, vertices_num=None, workers=None, stats=None):
+    """
+    Takes list of edges (see kruskal_mst.load_graph), optionally the number of
+    vertices (the highest label + 1 by default) and the number of worker
+    processes (the number of CPUs by default). Performs Boruvka's algorithm.
+    Returns list of tuples forming minimum spanning tree.
+    If stats is given (see instrumentation.Stats) the number of rounds and
+    the time spent searching for the cheapest edges (the part done by the
+    workers) and contracting components (done by the calling process) are
+    recorded.
+    """
+    from multiprocessing import Pool, cpu_count
+    from multiprocessing.sharedctypes import RawArray
+    if vertices_num is None:
+        vertices_num = max(max(edge[0], edge[1]) for edge in graph) + 1 if graph else 0
+    if workers is None:
+        workers = cpu_count()
+    tails = array('i', (edge[0] for edge in graph))
+    heads = array('i', (edge[1] for edge in graph))
+    weights = array('l', (edge[2] for edge in graph))
+    component = RawArray('i', vertices_num)
+    step = -(-len(graph) // workers) or 1
+    partitions = [(begin, min(begin + step, len(graph)))
+                  for begin in xrange(0, len(graph), step)]
+    MST = []
+    diset = IntDSets(vertices_num)
+    pool = None
+    if workers > 1:
+        pool = Pool(workers, _init_worker, (tails, heads, weights, component))
+    else:
+        _init_worker(tails, heads, weights, component)
+    try:
+        while True:
+            start = time.time()
+            component[:] = diset.find_many(xrange(vertices_num))
+            searched = time.time()
+            if pool is None:
+                results = map(_cheapest, partitions)
+            else:
+                results = pool.map(_cheapest, partitions)
+            if stats is not None:
+                stats.count('boruvka_rounds')
+                stats.timing('cheapest', time.time() - searched)
+                stats.timing('contract', searched - start)
+                searched = time.time()
+            cheapest = {}
+            for result in results:
+                for leader, key in result.iteritems():
+                    best = cheapest.get(leader)
+                    if best is None or key < best:
+                        cheapest[leader] = key
+            added = 0
+            for weight, index in cheapest.itervalues():
+                if diset.union(tails[index], heads[index]):
+                    MST.append((tails[index], heads[index], weight))
+                    added += 1
+            if stats is not None:
+                stats.timing('contract', time.time() - searched)
+            if not added:
+                if stats is not None:
+                    stats.publish()
+                return MST
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
+def filter_kruskal(graph, vertices_num=None, threshold=1024, seed=None):
+    """
+    Takes list of edges (see kruskal_mst.load_graph) and optionally the number
+    of vertices. Performs Filter-Kruskal algorithm: edge lists longer than
+    threshold are split into edges lighter than, equal to and heavier than a
+    random pivot cost and processed in that order; every list is first
+    filtered of edges inside already connected components, so most heavy
+    edges are never sorted. Stops as soon as the tree spans all vertices
+    found in edges (labels without edges, like 0 in 1-based inputs, don't
+    count). Returns list of tuples forming minimum spanning tree.
+    """
+    if vertices_num is None:
+        vertices_num = max(max(edge[0], edge[1]) for edge in graph) + 1 if graph else 0
+    used = array('b', [0]) * vertices_num
+    for edge in graph:
+        used[edge[0]] = used[edge[1]] = 1
+    tree_size = sum(used) - 1
+    rand = random.Random(seed)
+    diset = IntDSets(vertices_num)
+    findset = diset.findset
+    MST = []
+    # Every entry is a list of edges and whether it's already sorted.
+    stack = [(graph, False)]
+    while stack and len(MST) < tree_size:
+        edges, is_sorted = stack.pop()
+        edges = [edge for edge in edges if findset(edge[0]) != findset(edge[1])]
+        if is_sorted or len(edges) <= threshold:
+            if not is_sorted:
+                edges.sort(key=lambda edge: edge[2])
+            for edge in edges:
+                if diset.union(edge[0], edge[1]):
+                    MST.append(edge)
+            continue
+        pivot = rand.choice(edges)[2]
+        light, equal, heavy = [], [], []
+        for edge in edges:
+            if edge[2] < pivot:
+                light.append(edge)
+            elif edge[2] == pivot:
+                equal.append(edge)
+            else:
+                heavy.append(edge)
+        # Edges of cost equal to the pivot need no sorting.
+        stack.extend(((heavy, False), (equal, True), (light, False)))
+    return MST
+
+
+def main(vertices_num=200000, edges_num=2000000, seed=0, workers=None):
+    """
+    Generates a random connected graph and compares running time of kruskal,
+    filter_kruskal and boruvka with growing number of workers (1, 2, 4, ...
+    up to the number of CPUs, or the given list), printing the speedup of
+    boruvka over its single worker run. As the search for the cheapest edges
+    is the only parallel part, its share of the single worker time bounds the
+    speedup (Amdahl's law), which is printed as well.
+    """
+    from multiprocessing import cpu_count
+    from .instrumentation import Stats
+    rand = random.Random(seed)
+    graph = [(vertex, rand.randrange(vertex), rand.randint(-10000, 10000))
+             for vertex in xrange(1, vertices_num)]
+    graph.extend((rand.randrange(vertices_num), rand.randrange(vertices_num),
+                  rand.randint(-10000, 10000))
+                 for _ in xrange(edges_num - len(graph)))
+    for name, engine in (('kruskal', kruskal), ('filter_kruskal', filter_kruskal)):
+        start = time.time()
+        cost = overall_cost(engine(graph))
+        print "%s: cost %s in %.2f s" % (name, cost, time.time() - start)
+    if workers is None:
+        workers = [1]
+        while workers[-1] * 2 <= cpu_count():
+            workers.append(workers[-1] * 2)
+    single = None
+    for workers_num in workers:
+        stats = Stats()
+        start = time.time()
+        cost = overall_cost(boruvka(graph, workers=workers_num, stats=stats))
+        seconds = time.time() - start
+        if single is None:
+            single = seconds
+            parallel = stats.timings['cheapest'] / seconds
+            print "boruvka: %s rounds, the cheapest edge search is %.0f%% of the time" % (
+                stats.counters['boruvka_rounds'], 100 * parallel)
+            print "speedup bound: %s" % ', '.join(
+                '%s workers %.2fx' % (bound, 1 / (1 - parallel + parallel / bound))
+                for bound in (2, 4, 8))
+        print "boruvka, %s workers: cost %s in %.2f s, speedup %.2fx (%s CPUs)" % (
+            workers_num, cost, seconds, single / seconds, cpu_count())
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        graph = load_graph(sys.argv[1])
+        print overall_cost(boruvka(graph)), overall_cost(filter_kruskal(graph))
+    else:
+        main()
@@ -0,0 +1,158 @@
+'''Python 2.7.12 implementation of parallel quick sort for numeric arrays.
+
+The top levels of partitioning are done by the calling process (with the
+three-way partition and pivot choice of quick_sort.introsort) until there are
+enough subranges for all workers. This part is serial. The partitioned array
+is then copied once into shared memory and a pool of processes sorts the
+subranges - only the bounds of every subrange are sent to the workers, never
+the elements. Inputs shorter than a threshold are sorted sequentially by
+introsort.'''
+
+from array import array
+from ctypes import addressof, c_char, memmove
+from heapq import heappush, heappop
+import time
+
+from .optional import optional_import
+from .quick_sort import choose_pivot, introsort, three_way_partition
+
+SEQUENTIAL_THRESHOLD = 2 ** 16
+RANGES_PER_WORKER = 4
+
+_shared = None
+_typecode = None
+
+
+def _init_worker(shared, typecode):
+    global _shared, _typecode
+    _shared = shared
+    _typecode = typecode
+
+
+def _sort_range(bounds):
+    '''Sorts the shared array between bounds. The range is copied into a
+    private array.array of the same type, sorted by introsort and copied back,
+    so a worker holds a copy of its range only.'''
+    beginning, end = bounds
+    chunk = array(_typecode, [0]) * (end - beginning)
+    nbytes = len(chunk) * chunk.itemsize
+    address = addressof(_shared) + beginning * chunk.itemsize
+    memmove(chunk.buffer_info()[0], address, nbytes)
+    introsort(chunk)
+    memmove(address, chunk.buffer_info()[0], nbytes)
+
+
+def to_array(inp):
+    '''Returns array.array with the elements of inp. Takes list, array.array or
+    an object supporting the buffer protocol with a format that is an array
+    typecode (for ex. bytearray or a numpy array). Lists of integers become
+    arrays of longs and lists with floats arrays of doubles.'''
+    if isinstance(inp, array):
+        return array(inp.typecode, inp)
+    if isinstance(inp, list):
+        typecode = 'd' if any(isinstance(item, float) for item in inp) else 'l'
+        return array(typecode, inp)
+    view = memoryview(inp)
+    typecode = view.format.lstrip('@=<>!')
+    if typecode not in 'bBhHiIlLfd' or len(typecode) != 1:
+        raise TypeError("Can't sort buffer of format %r" % (view.format, ))
+    result = array(typecode)
+    result.fromstring(view.tobytes())
+    return result
+
+
+def partition_ranges(arr, ranges_num, threshold):
+    '''Partitions arr in place, always splitting the largest range, until there
+    are ranges_num ranges or all of them are shorter than threshold. Elements
+    equal to pivots end up in their final positions and belong to no range.
+    Returns list of (beginning, end) tuples.'''
+    heap = [(-len(arr), 0, len(arr))]
+    ranges = []
+    while heap and len(heap) + len(ranges) < ranges_num:
+        size, beginning, end = heappop(heap)
+        if -size <= threshold:
+            ranges.append((beginning, end))
+            continue
+        lower, upper = three_way_partition(arr, beginning, end,
+                                           choose_pivot(arr, beginning, end))
+        for part in ((beginning, lower), (upper, end)):
+            if part[1] - part[0] > 1:
+                heappush(heap, (part[0] - part[1], part[0], part[1]))
+    ranges.extend((beginning, end) for _, beginning, end in heap)
+    return ranges
+
+
+def parallel_quick_sort(inp, workers=None, threshold=SEQUENTIAL_THRESHOLD):
+    '''Sorts list, array.array or writable buffer of numbers in place using
+    the given number of worker processes (the number of CPUs by default).
+    array.array is partitioned in place; lists and buffers are first copied
+    into an array.array (see to_array), so they take one more copy of the
+    input. The partitioned array is copied into shared memory for the workers
+    and back when they finish.'''
+    from multiprocessing import Pool, cpu_count
+    from multiprocessing.sharedctypes import RawArray
+    if workers is None:
+        workers = cpu_count()
+    if isinstance(inp, (list, array)) and (workers <= 1 or len(inp) <= threshold):
+        introsort(inp)
+        return
+    arr = inp if isinstance(inp, array) else to_array(inp)
+    nbytes = len(arr) * arr.itemsize
+    if workers <= 1 or len(arr) <= threshold:
+        introsort(arr)
+    else:
+        ranges = partition_ranges(arr, workers * RANGES_PER_WORKER, threshold)
+        shared = RawArray(arr.typecode, len(arr))
+        memmove(shared, arr.buffer_info()[0], nbytes)
+        pool = Pool(workers, _init_worker, (shared, arr.typecode))
+        try:
+            pool.map(_sort_range, ranges, 1)
+        finally:
+            pool.terminate()
+        memmove(arr.buffer_info()[0], shared, nbytes)
+    if isinstance(inp, list):
+        inp[:] = arr.tolist()
+    elif arr is not inp:
+        # Buffers may have items of any size (memoryview assignment would
+        # require bytes), so the elements are copied to the buffer's address.
+        memmove(addressof((c_char * nbytes).from_buffer(inp)), arr.buffer_info()[0], nbytes)
+
+
+def main(argv=None):
+    '''Sorts integers from a file (or random ones) with the given number of
+    workers. Without a file and --workers, sorts the same random array with
+    growing number of workers (and a NumPy array, if NumPy is installed)
+    and prints running times.'''
+    from multiprocessing import cpu_count
+    from .cli import load_numbers, numbers_parser
+    parser = numbers_parser("Sorts integers with parallel quick sort.", size=10 ** 6)
+    parser.add_argument('--workers', type=int, help="number of processes (the number of CPUs by default)")
+    args = parser.parse_args(argv)
+    numbers = load_numbers(args)
+    inp = array('l', numbers)
+    expected = sorted(numbers)
+    if args.numbers_file is not None or args.workers is not None:
+        start = time.time()
+        parallel_quick_sort(inp, args.workers)
+        print "%s numbers: %.2f s, correctly sorted: %s" % (
+            len(inp), time.time() - start, inp.tolist() == expected)
+        return
+    workers = 1
+    while workers <= cpu_count():
+        arr = array('l', inp)
+        start = time.time()
+        parallel_quick_sort(arr, workers)
+        print "%s workers: %.2f s, correctly sorted: %s" % (
+            workers, time.time() - start, arr.tolist() == expected)
+        workers *= 2
+    numpy = optional_import('numpy')
+    if numpy is not None:
+        numbers = numpy.array(inp, dtype=numpy.int64)
+        start = time.time()
+        parallel_quick_sort(numbers, max(cpu_count(), 2))
+        print "numpy array: %.2f s, correctly sorted: %s" % (
+            time.time() - start, numbers.tolist() == expected)
+
+
+if __name__ == "__main__":
+    main()
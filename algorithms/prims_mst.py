@@ -0,0 +1,125 @@
+"""
+Python 2.7 implementation of Prim's algorithm for finding minimum spanning tree
+of a graph.
+"""
+import time
+from collections import defaultdict
+from heapq import heappush, heappop
+from itertools import izip
+
+from .graph_loader import data_file, is_snapshot, read_columns
+
+def load_graph(inp):
+    """
+    Takes name of the file containing representation of a undirected, weighted
+    graph. Loads graph from a given file. Returns dictionary that models a graph.
+
+    Input format: This file describes an undirected graph with integer edge costs.
+    It has the following format:
+    [number_of_nodes] [number_of_edges]
+    [one_node_of_edge_1] [other_node_of_edge_1] [edge_1_cost]
+    [one_node_of_edge_2] [other_node_of_edge_2] [edge_2_cost]
+    For example, the third line of the file is "2 3 -8874", indicating that
+    there is an edge connecting vertex #2 and vertex #3 that has cost -8874.
+    The edge costs may be positive or negative and do not have to be distinct.
+    The file is parsed in bulk and may be compressed (see graph_loader).
+    If the file is a snapshot of an undirected graph (see graph_snapshot) the
+    memory-mapped csr_graph.CSRGraph is returned instead.
+    """
+    if is_snapshot(inp):
+        from . import graph_snapshot
+        graph = graph_snapshot.load(inp)
+        if not graph.symmetric:
+            raise ValueError("%s is not a snapshot of an undirected graph" % inp)
+        return graph
+    graph = defaultdict(list)
+    for tail, head, weight in izip(*read_columns(inp, 'iil')):
+        graph[tail].append((head, weight))
+        graph[head].append((tail, weight))
+    return graph
+
+def mst_prim(graph, root=1, queue=None, stats=None):
+    """
+    Takes graph and starting vertex and performs Prim's algorithm for finding
+    minimum spanning tree. Returns dictionary of nodes with corresponding costs
+    of adding them to the tree (indicators) and dictionary of parents of each of
+    the nodes in the tree.
+    During the execution of the algorithm, vertices that are not already in the
+    tree are put in a min-priority queue based on a key attribute. The key
+    attribute is the minimum weight of any edge connecting verex not in the tree
+    to a vertex in the tree.
+    Supposed to run in O(E + V lg V).
+    The graph is either a dictionary of lists of (vertex, weight) tuples (see
+    load_graph) or a symmetric, weighted csr_graph.CSRGraph.
+    By default the min-priority queue is a heapq list with duplicate entries,
+    which are skipped when popped. Queue may be a function returning a queue
+    with decrease-key instead (for ex. priority_queue.DaryHeap).
+    If stats is given (see instrumentation.Stats) the counts of heap pushes,
+    pops and stale pops (of vertices already in the tree) are recorded.
+    """
+
+    indicators = dict.fromkeys(graph.keys(), float('inf'))
+    predecessors = dict.fromkeys(graph.keys(), None)
+    # Keeps track of what has been sucked into the MS tree.
+    tree = dict.fromkeys(graph.keys(), False)
+    indicators[root] = 0
+    # The default heapq list is used directly, pop and push are only for the
+    # pluggable queues.
+    heap = queue is None
+    heap_push, heap_pop = heappush, heappop
+    if heap:
+        pq = [(0, root)]
+    else:
+        pq = queue()
+        pop, push = pq.pop, pq.update
+        push(root, 0)
+    if stats is not None:
+        pops_before = stats.counters['heap_pops']
+        if heap:
+            heap_push = stats.counting('heap_pushes', heappush)
+            heap_pop = stats.counting('heap_pops', heappop)
+        else:
+            push, pop = stats.counting('heap_pushes', push), stats.counting('heap_pops', pop)
+    adjacent = graph.adjacent if hasattr(graph, 'adjacent') else graph.__getitem__
+    while pq:
+        popped = heap_pop(pq) if heap else pop()
+        if tree[popped[1]]:
+            continue
+        tree[popped[1]] = True
+        for vertex in adjacent(popped[1]):
+            if tree[vertex[0]] == False and vertex[1] < indicators[vertex[0]]:
+                indicators[vertex[0]] = vertex[1]
+                predecessors[vertex[0]] = popped[1]
+                if heap:
+                    heap_push(pq, (vertex[1], vertex[0]))
+                else:
+                    push(vertex[0], vertex[1])
+    if stats is not None:
+        stats.count('stale_pops', stats.counters['heap_pops'] - pops_before - sum(tree.itervalues()))
+        stats.publish()
+    return indicators, predecessors
+
+def overall_cost(indicators):
+    """
+    Calculates the overall cost of a minimum spanning tree: an integer, which
+    may or may not be negative.
+    """
+    return sum(indicators.values())
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Computes minimum spanning tree with Prim's algorithm.")
+    parser.add_argument('graph_file', nargs='?', default=data_file('prims_mst.txt'),
+                        help="text file (see load_graph) or snapshot")
+    parser.add_argument('--root', type=int, default=1)
+    args = parser.parse_args(argv)
+    start = time.clock()
+    graph = load_graph(args.graph_file)
+    indicators, predecessors = mst_prim(graph, args.root)
+    cost = overall_cost(indicators)
+    print cost # Correct answer for prims_mst.txt: 37
+    print "Time: ", time.clock()-start
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Min-priority queues of integer items (vertex labels) with the decrease-key
+operation, for dijkstra.dijkstra and prims_mst.mst_prim.
+
+All queues share the same interface:
+
+update(item, key)  # inserts item with the given key or, if item is already in
+                     the queue with a greater key, decreases its key - returns
+                     True if the queue changed
+pop()              # removes and returns (key, item) with the minimum key
+len(queue)         # number of items in the queue
+item in queue      # whether item is in the queue
+
+Each queue counts its pushes, pops and decreases.
+
+DaryHeap      # indexed d-ary heap, positions of items are kept in an array
+PairingHeap   # pairing heap, O(1) amortized insert and meld
+LazyHeap      # heapq with duplicate entries instead of decrease-key (the
+                approach used by default); stale entries are skipped and
+                counted
+"""
+
+from array import array
+from heapq import heappush, heappop
+import random
+import time
+
+
+class DaryHeap(object):
+    """
+    Indexed d-ary min-heap. Keys and items are kept in heap order in two
+    parallel sequences and position[item] is the index of item in them (-1
+    if it isn't in the heap). The position array grows with the highest item.
+    """
+
+    def __init__(self, size=0, arity=4):
+        self.arity = arity
+        self.keys = []
+        self.items = array('i')
+        self.position = array('i', [-1]) * size
+        self.pushes = self.pops = self.decreases = 0
+
+
+    def __len__(self):
+        return len(self.items)
+
+
+    def __contains__(self, item):
+        return item < len(self.position) and self.position[item] != -1
+
+
+    def update(self, item, key):
+        position = self.position
+        if item >= len(position):
+            position.extend(array('i', [-1]) * (item + 1 - len(position)))
+        index = position[item]
+        if index == -1:
+            self.pushes += 1
+            index = len(self.items)
+            self.keys.append(key)
+            self.items.append(item)
+        elif key < self.keys[index]:
+            self.decreases += 1
+        else:
+            return False
+        self._sift_up(index, item, key)
+        return True
+
+
+    def pop(self):
+        keys, items, position = self.keys, self.items, self.position
+        self.pops += 1
+        key, item = keys[0], items[0]
+        position[item] = -1
+        last_key, last_item = keys.pop(), items.pop()
+        if items:
+            self._sift_down(0, last_item, last_key)
+        return key, item
+
+
+    def _sift_up(self, index, item, key):
+        keys, items, position, arity = self.keys, self.items, self.position, self.arity
+        while index > 0:
+            parent = (index - 1) // arity
+            if keys[parent] <= key:
+                break
+            keys[index], items[index] = keys[parent], items[parent]
+            position[items[index]] = index
+            index = parent
+        keys[index], items[index] = key, item
+        position[item] = index
+
+
+    def _sift_down(self, index, item, key):
+        keys, items, position, arity = self.keys, self.items, self.position, self.arity
+        size = len(items)
+        while True:
+            first = index * arity + 1
+            if first >= size:
+                break
+            smallest = first
+            for child in xrange(first + 1, min(first + arity, size)):
+                if keys[child] < keys[smallest]:
+                    smallest = child
+            if keys[smallest] >= key:
+                break
+            keys[index], items[index] = keys[smallest], items[smallest]
+            position[items[index]] = index
+            index = smallest
+        keys[index], items[index] = key, item
+        position[item] = index
+
+
+class PairingHeap(object):
+    """
+    Pairing min-heap. Every node is a list [key, item, child, sibling,
+    previous] where previous is the parent for the first child and the left
+    sibling otherwise. Nodes of the items in the heap are kept in a dictionary.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.nodes = {}
+        self.pushes = self.pops = self.decreases = 0
+
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+    def __contains__(self, item):
+        return item in self.nodes
+
+
+    def update(self, item, key):
+        node = self.nodes.get(item)
+        if node is None:
+            self.pushes += 1
+            node = self.nodes[item] = [key, item, None, None, None]
+            self.root = self._meld(self.root, node)
+            return True
+        if key >= node[0]:
+            return False
+        self.decreases += 1
+        node[0] = key
+        if node is not self.root:
+            # Cuts the subtree rooted at node and melds it with the root.
+            previous, sibling = node[4], node[3]
+            if previous[2] is node:
+                previous[2] = sibling
+            else:
+                previous[3] = sibling
+            if sibling is not None:
+                sibling[4] = previous
+            node[3] = node[4] = None
+            self.root = self._meld(self.root, node)
+        return True
+
+
+    def pop(self):
+        self.pops += 1
+        root = self.root
+        del self.nodes[root[1]]
+        # Two-pass pairing: melds children in pairs left to right, then melds
+        # the pairs right to left.
+        pairs = []
+        child = root[2]
+        while child is not None:
+            first, second = child, child[3]
+            child = second[3] if second is not None else None
+            first[3] = first[4] = None
+            if second is not None:
+                second[3] = second[4] = None
+            pairs.append(self._meld(first, second))
+        merged = None
+        while pairs:
+            merged = self._meld(pairs.pop(), merged)
+        self.root = merged
+        return root[0], root[1]
+
+
+    @staticmethod
+    def _meld(first, second):
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if second[0] < first[0]:
+            first, second = second, first
+        second[3] = first[2]
+        if first[2] is not None:
+            first[2][4] = second
+        second[4] = first
+        first[2] = second
+        return first
+
+
+class LazyHeap(object):
+    """
+    Binary heap (heapq) without decrease-key: update pushes a new entry and the
+    outdated ones are skipped (and counted as stale) when popped.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.keys = {}
+        self.pushes = self.pops = self.stale = 0
+
+
+    def __len__(self):
+        return len(self.keys)
+
+
+    def __contains__(self, item):
+        return item in self.keys
+
+
+    def update(self, item, key):
+        if item in self.keys and self.keys[item] <= key:
+            return False
+        self.pushes += 1
+        self.keys[item] = key
+        heappush(self.heap, (key, item))
+        return True
+
+
+    def pop(self):
+        while True:
+            self.pops += 1
+            key, item = heappop(self.heap)
+            if self.keys.get(item) == key:
+                del self.keys[item]
+                return key, item
+            self.stale += 1
+
+
+def compare(vertices_num=20000, degree=8, seed=0):
+    """
+    Runs dijkstra.dijkstra and prims_mst.mst_prim on a random graph with the
+    default lazy heapq and with every queue from this module. Prints wall time
+    and heap operation counts.
+    """
+    from .dijkstra import dijkstra
+    from .prims_mst import mst_prim
+    rand = random.Random(seed)
+    digraph = dict((vertex, {}) for vertex in xrange(1, vertices_num + 1))
+    graph = dict((vertex, []) for vertex in xrange(1, vertices_num + 1))
+    for tail in xrange(1, vertices_num + 1):
+        for _ in xrange(degree):
+            head, weight = rand.randint(1, vertices_num), rand.randint(1, 1000)
+            digraph[tail][head] = weight
+            graph[tail].append((head, weight))
+            graph[head].append((tail, weight))
+    for name, algorithm, inp in (('dijkstra', dijkstra, digraph),
+                                 ('mst_prim', mst_prim, graph)):
+        for queue in (None, LazyHeap, DaryHeap, PairingHeap):
+            instances = []
+            def factory():
+                instances.append(queue())
+                return instances[-1]
+            start = time.clock()
+            algorithm(inp, 1, queue=factory if queue else None)
+            elapsed = time.clock() - start
+            counts = ''
+            if instances:
+                counts = ', '.join('%s: %s' % (counter, getattr(instances[0], counter))
+                                   for counter in ('pushes', 'pops', 'decreases', 'stale')
+                                   if hasattr(instances[0], counter))
+            print "%s with %s: %.3f s %s" % (
+                name, queue.__name__ if queue else 'heapq', elapsed, counts)
+
+
+if __name__ == "__main__":
+    compare()
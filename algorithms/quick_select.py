@@ -0,0 +1,109 @@
+'''Python 2.7.12 implementation of selection (finding the k-th smallest element)
+and partial sorting built on the partition procedures of quick sort (based on
+pseudocode given in "Introduction to Algorithms" - Cormen, Leiserson et al.)
+
+Randomized select partitions only the part of the array containing the k-th
+element, so it runs in O(n) expected time. If it makes too many partitions
+(more than 2 lg n) it switches to the median-of-medians pivot, which guarantees
+O(n) time in the worst case.'''
+
+from .quick_sort import insertion_sort, introsort, three_way_partition
+from .randomized_quick_sort import randomized_partition
+
+
+def select(inp, k, beginning=0, end=None):
+    '''Returns the element which would be at index k if inp[beginning:end] was
+    sorted. Rearranges inp in place, so that inp[k] is that element, elements
+    before it are not greater and elements after it are not smaller.'''
+    if end is None:
+        end = len(inp)
+    if not beginning <= k < end:
+        raise IndexError('select index out of range')
+    budget = 2 * (end - beginning).bit_length()
+    while end - beginning > 1:
+        if budget == 0:
+            return deterministic_select(inp, k, beginning, end)
+        budget -= 1
+        q = randomized_partition(inp, beginning, end)
+        if k == q:
+            return inp[q]
+        elif k < q:
+            end = q
+        else:
+            beginning = q + 1
+    return inp[k]
+
+def deterministic_select(inp, k, beginning, end):
+    '''Select with the median-of-medians pivot and three-way partitioning.
+    Runs in O(n) time in the worst case, duplicates included.'''
+    while end - beginning > 5:
+        pivot = median_of_medians(inp, beginning, end)
+        lower, upper = three_way_partition(inp, beginning, end, pivot)
+        if k < lower:
+            end = lower
+        elif k < upper:
+            return inp[k]
+        else:
+            beginning = upper
+    insertion_sort(inp, beginning, end)
+    return inp[k]
+
+def median_of_medians(inp, beginning, end):
+    '''Returns the median of medians of groups of five elements of
+    inp[beginning:end].'''
+    medians = []
+    for group in xrange(beginning, end, 5):
+        chunk = sorted(inp[group:min(group + 5, end)])
+        medians.append(chunk[(len(chunk) - 1) // 2])
+    return deterministic_select(medians, (len(medians) - 1) // 2, 0, len(medians))
+
+def partial_sort(inp, k):
+    '''Rearranges inp in place so that inp[:k] are its k smallest elements in
+    sorted order. Runs in O(n + k lg k) expected time.'''
+    k = min(k, len(inp))
+    if k <= 0:
+        return
+    select(inp, k - 1)
+    introsort(inp, 0, k)
+
+def nsmallest(inp, k):
+    '''Returns sorted list of k smallest elements of inp (which is not
+    modified).'''
+    items = list(inp)
+    partial_sort(items, k)
+    return items[:max(k, 0)]
+
+def nlargest(inp, k):
+    '''Returns list of k largest elements of inp in decreasing order (inp is
+    not modified).'''
+    items = list(inp)
+    k = min(max(k, 0), len(items))
+    if k == 0:
+        return []
+    select(items, len(items) - k)
+    largest = items[len(items) - k:]
+    introsort(largest)
+    largest.reverse()
+    return largest
+
+
+def main(argv=None):
+    """
+    Prints the k-th smallest of integers from a file (or random ones), the
+    median by default, and their smallest and largest elements.
+    """
+    from .cli import load_numbers, numbers_parser
+    parser = numbers_parser("Selects the k-th smallest integer.")
+    parser.add_argument('--k', type=int, help="index in sorted order (the median by default)")
+    parser.add_argument('--smallest', type=int, default=5, help="number of smallest elements printed")
+    parser.add_argument('--largest', type=int, default=5, help="number of largest elements printed")
+    args = parser.parse_args(argv)
+    numbers = load_numbers(args)
+    k = (len(numbers) - 1) // 2 if args.k is None else args.k
+    print "Element %s in sorted order: " % k, select(numbers[:], k)
+    print "%s smallest: " % args.smallest, nsmallest(numbers, args.smallest)
+    print "%s largest: " % args.largest, nlargest(numbers, args.largest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+'''Python 2.7.12 implementation of quick sort (based on pseudocode given in
+"Introduction to Algorithms" - Cormen, Leiserson et al.)
+
+It also contains introsort - a hybrid of quick sort with median-of-three (or
+ninther) pivots and three-way partitioning, insertion sort for small ranges
+and heap sort as a fallback when recursion gets too deep. It runs in
+O(n log n) time and O(log n) stack on any input, including sorted and
+duplicate-heavy ones.'''
+
+INSERTION_SORT_THRESHOLD = 16
+NINTHER_THRESHOLD = 128
+
+def partition(inp, beginning, end):
+    '''Takes unsorted array, choses its last element as a pivot and partitions
+    input array around it (puts all elements smaller than the pivot on the left
+    of the pivot and all greater on the right of it). Returns index of pivot
+    after its inserted in its rightful position.'''
+
+    if len(inp) == 0:
+        return inp
+    pivot = inp[end-1]
+    index = beginning - 1
+    for dummy_index in xrange(beginning, end-1):
+        if inp[dummy_index] <= pivot:
+            index += 1
+            if dummy_index != index:
+                inp[index], inp[dummy_index] = inp[dummy_index], inp[index]
+    inp[end-1], inp[index+1] = inp[index+1], inp[end-1]
+    return index+1
+
+def quick_sort(inp, beginning, end, stats=None, depth=0):
+    '''Sorts unsorted array in place. If stats is given (see
+    instrumentation.Stats) the recursion depth of every partition and the
+    number of exchanges of the pseudocode (including exchanges of an element
+    with itself, which partition skips) are recorded. Depth is the number of
+    partitions above the range.'''
+    if beginning < end:
+        q = partition(inp, beginning, end)
+        if stats is not None:
+            stats.count('partitions')
+            stats.observe('partition_depth', depth)
+            stats.count('swaps', q - beginning + 1)
+        quick_sort(inp, beginning, q, stats, depth + 1)
+        quick_sort(inp, q+1, end, stats, depth + 1)
+
+def insertion_sort(inp, beginning, end):
+    '''Sorts inp[beginning:end] in place by insertion.'''
+    for index in xrange(beginning + 1, end):
+        key = inp[index]
+        position = index - 1
+        while position >= beginning and inp[position] > key:
+            inp[position + 1] = inp[position]
+            position -= 1
+        inp[position + 1] = key
+
+def sift_down(inp, offset, root, size):
+    '''Restores the max-heap property of the heap of given size stored in
+    inp from the index offset, assuming only the root may violate it.'''
+    item = inp[offset + root]
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and inp[offset + child] < inp[offset + child + 1]:
+            child += 1
+        if not item < inp[offset + child]:
+            break
+        inp[offset + root] = inp[offset + child]
+        root = child
+    inp[offset + root] = item
+
+def heap_sort(inp, beginning, end):
+    '''Sorts inp[beginning:end] in place by heap sort.'''
+    size = end - beginning
+    for root in xrange(size // 2 - 1, -1, -1):
+        sift_down(inp, beginning, root, size)
+    for last in xrange(size - 1, 0, -1):
+        inp[beginning], inp[beginning + last] = inp[beginning + last], inp[beginning]
+        sift_down(inp, beginning, 0, last)
+
+def median_of_three(first, second, third):
+    '''Returns the median of three values.'''
+    if first < second:
+        if second < third:
+            return second
+        return third if first < third else first
+    if first < third:
+        return first
+    return third if second < third else second
+
+def choose_pivot(inp, beginning, end):
+    '''Returns median of the first, middle and last element of inp[beginning:end]
+    or, for ranges longer than NINTHER_THRESHOLD, Tukey's ninther (median of
+    medians of three evenly spread triples).'''
+    middle = beginning + (end - beginning) // 2
+    last = end - 1
+    if end - beginning <= NINTHER_THRESHOLD:
+        return median_of_three(inp[beginning], inp[middle], inp[last])
+    step = (end - beginning) // 8
+    return median_of_three(
+        median_of_three(inp[beginning], inp[beginning + step], inp[beginning + 2 * step]),
+        median_of_three(inp[middle - step], inp[middle], inp[middle + step]),
+        median_of_three(inp[last - 2 * step], inp[last - step], inp[last]))
+
+def three_way_partition(inp, beginning, end, pivot):
+    '''Partitions inp[beginning:end] around pivot value into three parts
+    (Dutch national flag): smaller than, equal to and greater than the pivot.
+    Returns (lower, upper) such that inp[beginning:lower] < pivot,
+    inp[lower:upper] == pivot and inp[upper:end] > pivot.'''
+    lower, index, upper = beginning, beginning, end
+    while index < upper:
+        item = inp[index]
+        if item < pivot:
+            inp[lower], inp[index] = item, inp[lower]
+            lower += 1
+            index += 1
+        elif pivot < item:
+            upper -= 1
+            inp[index], inp[upper] = inp[upper], item
+        else:
+            index += 1
+    return lower, upper
+
+def introsort(inp, beginning=0, end=None, depth_limit=None, stats=None, depth=0):
+    '''Sorts unsorted array in place. Recurses only into the smaller part of
+    each partition and loops over the larger one, so the stack stays
+    O(log n). Switches to heap sort when depth_limit (2 lg n by default)
+    partitions didn't get the range below INSERTION_SORT_THRESHOLD.
+    If stats is given (see instrumentation.Stats) the depth (the number of
+    partitions above the range) and the number of swaps of every partition
+    and the number of heap sort fallbacks are recorded.'''
+    if end is None:
+        end = len(inp)
+    if depth_limit is None:
+        depth_limit = 2 * max(end - beginning, 1).bit_length()
+    while end - beginning > INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            if stats is not None:
+                stats.count('heap_sort_fallbacks')
+            heap_sort(inp, beginning, end)
+            return
+        depth_limit -= 1
+        pivot = choose_pivot(inp, beginning, end)
+        lower, upper = three_way_partition(inp, beginning, end, pivot)
+        if stats is not None:
+            # Every element smaller or greater than the pivot is swapped once.
+            stats.count('partitions')
+            stats.observe('partition_depth', depth)
+            stats.count('swaps', (lower - beginning) + (end - upper))
+        depth += 1
+        if lower - beginning < end - upper:
+            introsort(inp, beginning, lower, depth_limit, stats, depth)
+            beginning = upper
+        else:
+            introsort(inp, upper, end, depth_limit, stats, depth)
+            end = lower
+    insertion_sort(inp, beginning, end)
+
+
+def main(argv=None):
+    """
+    Sorts integers from a file (or random ones) with introsort or quick_sort.
+    """
+    from .cli import sort_main
+    sort_main("Sorts integers with introsort or quick sort.",
+              [('introsort', introsort),
+               ('quick_sort', lambda inp: quick_sort(inp, 0, len(inp)))], argv)
+
+
+if __name__ == "__main__":
+    main()
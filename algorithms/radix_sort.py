@@ -0,0 +1,71 @@
+'''Python 2.7.12 implementation of LSD radix sort (based on pseudocode given in
+"Introduction to Algorithms" - Cormen, Leiserson et al.) for signed integer
+keys.
+
+Keys are shifted by the minimum key so all of them are non-negative, and sorted
+by counting sort on consecutive RADIX_BITS-bit digits, starting from the least
+significant one. If the range of keys is small (not greater than the number of
+keys or the number of buckets of one digit) a single counting sort pass is
+made. Runs in O(d(n + k)) time for d digits with k possible values each.
+
+argsort(keys)    # returns array of indices ordering keys (stable)
+radix_sort(inp)  # sorts list or array of integers in place
+'''
+
+from array import array
+
+RADIX_BITS = 8
+
+
+def counting_pass(keys, order, low, shift, buckets):
+    '''Stable counting sort of indices in order by the digit
+    ((keys[index] - low) >> shift) % buckets. Returns new array of indices.'''
+    digits = [((keys[index] - low) >> shift) % buckets for index in order]
+    counts = [0] * (buckets + 1)
+    for digit in digits:
+        counts[digit + 1] += 1
+    for digit in xrange(buckets):
+        counts[digit + 1] += counts[digit]
+    result = array(order.typecode, [0]) * len(order)
+    for position, index in enumerate(order):
+        digit = digits[position]
+        result[counts[digit]] = index
+        counts[digit] += 1
+    return result
+
+def argsort(keys, radix_bits=RADIX_BITS):
+    '''Takes sequence (list or array) of integers. Returns array of indices
+    that orders keys non-decreasingly. Indices of equal keys keep their
+    relative order.'''
+    order = array('l', xrange(len(keys)))
+    if len(keys) < 2:
+        return order
+    low = min(keys)
+    span = max(keys) - low
+    if span < max(len(keys), 1 << radix_bits):
+        return counting_pass(keys, order, low, 0, span + 1)
+    shift = 0
+    while span >> shift:
+        order = counting_pass(keys, order, low, shift, 1 << radix_bits)
+        shift += radix_bits
+    return order
+
+def radix_sort(inp, radix_bits=RADIX_BITS):
+    '''Sorts list or array of integers in place.'''
+    values = [inp[index] for index in argsort(inp, radix_bits)]
+    if isinstance(inp, array):
+        inp[:] = array(inp.typecode, values)
+    else:
+        inp[:] = values
+
+
+def main(argv=None):
+    """
+    Sorts integers from a file (or random ones) with radix sort.
+    """
+    from .cli import sort_main
+    sort_main("Sorts integers with LSD radix sort.", [('radix_sort', radix_sort)], argv)
+
+
+if __name__ == "__main__":
+    main()
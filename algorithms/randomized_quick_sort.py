@@ -22,7 +22,7 @@ def partition(inp, beginning, end):
     return index+1
 
 def randomized_partition(inp, beginning, end):
-    rand_pivot_index = random.choice(range(beginning, end))
+    rand_pivot_index = random.randrange(beginning, end)
     inp[rand_pivot_index], inp[end-1] = inp[end-1], inp[rand_pivot_index]
     return partition(inp, beginning, end)
 
@@ -33,17 +33,15 @@ def randomized_quick_sort(inp, beginning, end):
         randomized_quick_sort(inp, beginning, q)
         randomized_quick_sort(inp, q+1, end)
 
-# Some tests:
-dummy_range = 100
-# Creating unordered list of integers in given range to be sorted by quick_sort.
-qs_inp = range(dummy_range)
-random.shuffle(qs_inp)
-#Making a copy of unordered list to be sorted by Python to check quick_sort correctnes.
-py_inp = qs_inp[:]
-print 'I am unordered list: \n', qs_inp
-print
-randomized_quick_sort(qs_inp, 0, len(qs_inp))
-py_inp.sort()
-print 'I am list after quick_sort: \n', qs_inp
-print
-print "Input list is correctly sorted: ", py_inp == qs_inp
+def main(argv=None):
+    """
+    Sorts integers from a file (or random ones) with randomized quick sort.
+    """
+    from .cli import sort_main
+    sort_main("Sorts integers with randomized quick sort.",
+              [('randomized_quick_sort', lambda inp: randomized_quick_sort(inp, 0, len(inp)))],
+              argv)
+
+
+if __name__ == "__main__":
+    main()
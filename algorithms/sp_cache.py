@@ -0,0 +1,137 @@
+"""
+Cache of shortest-path trees computed by dijkstra.dijkstra. Trees are kept per
+(graph version, source) with least-recently-used eviction bounded by their
+approximate size in bytes. The graph is mutated through VersionedGraph, whose
+every change bumps the version, so trees computed before a change are never
+returned after it.
+"""
+import sys
+from collections import OrderedDict
+
+from .dijkstra import dijkstra, load_graph
+from .graph_loader import data_file
+
+
+class VersionedGraph(dict):
+    """
+    Models a weighted, directed graph as a dictionary of dictionaries (see
+    dijkstra.load_graph) with a version number that is incremented on every
+    change made through add_edge, set_weight or remove_edge. Changes made by
+    modifying the dictionaries directly are not tracked.
+    """
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.version = 0
+
+
+    def add_edge(self, tail, head, weight):
+        """
+        Adds edge (tail, head) of the given length (or replaces its length).
+        Both vertices are added to the graph if they aren't there yet.
+        """
+        self.setdefault(tail, {})[head] = weight
+        self.setdefault(head, {})
+        self.version += 1
+
+
+    def set_weight(self, tail, head, weight):
+        """
+        Changes the length of an existing edge. Raises KeyError if there's no
+        such edge.
+        """
+        if head not in self[tail]:
+            raise KeyError((tail, head))
+        self[tail][head] = weight
+        self.version += 1
+
+
+    def remove_edge(self, tail, head):
+        """
+        Removes an existing edge. Raises KeyError if there's no such edge.
+        """
+        del self[tail][head]
+        self.version += 1
+
+
+class SPTreeCache(object):
+    """
+    Keeps shortest-path trees (sp_estimate, predecessors) of a VersionedGraph
+    keyed by (version, source), evicting the least recently used ones when
+    their total size exceeds max_bytes. Returned dictionaries are shared with
+    the cache and must not be modified.
+    """
+
+    def __init__(self, graph, max_bytes=64 * 2 ** 20):
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.trees = OrderedDict()
+        self.sizes = {}
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+
+    def shortest_paths(self, source):
+        """
+        Returns (sp_estimate, predecessors) for the given source, computing
+        them with dijkstra only if they aren't cached for the current version
+        of the graph.
+        """
+        version = self.graph.version
+        if self.trees and next(iter(self.trees))[0] != version:
+            self.invalidations += 1
+            self.clear()
+        key = (version, source)
+        tree = self.trees.pop(key, None)
+        if tree is not None:
+            self.hits += 1
+            self.trees[key] = tree
+            return tree
+        self.misses += 1
+        tree = dijkstra(self.graph, source)
+        size = tree_size(tree)
+        if size <= self.max_bytes:
+            self.trees[key] = tree
+            self.sizes[key] = size
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                old_key, _ = self.trees.popitem(last=False)
+                self.bytes -= self.sizes.pop(old_key)
+                self.evictions += 1
+        return tree
+
+
+    def clear(self):
+        self.trees.clear()
+        self.sizes.clear()
+        self.bytes = 0
+
+
+    def stats(self):
+        """
+        Returns dictionary with counters and the current size of the cache.
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'invalidations': self.invalidations,
+                'trees': len(self.trees), 'bytes': self.bytes}
+
+
+def tree_size(tree):
+    """
+    Approximates the number of bytes taken by a shortest-path tree: both
+    dictionaries and the distances they hold (vertex labels are assumed to be
+    shared with the graph).
+    """
+    sp_estimate, predecessors = tree
+    return (sys.getsizeof(sp_estimate) + sys.getsizeof(predecessors) +
+            sum(sys.getsizeof(dist) for dist in sp_estimate.itervalues()))
+
+
+if __name__ == "__main__":
+    graph = VersionedGraph(load_graph(data_file("dijkstra.txt")))
+    cache = SPTreeCache(graph)
+    print cache.shortest_paths(1)[0]
+    print cache.shortest_paths(1)[0]
+    graph.set_weight(1, 3, 2)
+    print cache.shortest_paths(1)[0]
+    print cache.stats()
@@ -0,0 +1,9 @@
+"""
+Benchmarks of the algorithms of this repository on synthetic, seeded inputs.
+
+generators  # random, power-law and grid graphs, SCC-heavy digraphs,
+              adversarial inputs for sorting and interval scheduling
+runner      # runs benchmarks, records wall time, peak RSS and operation
+              counts into a JSON history and flags regressions against a
+              stored baseline (python -m benchmarks.runner --help)
+"""
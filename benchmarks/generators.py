@@ -0,0 +1,172 @@
+"""
+Seeded generators of synthetic benchmark inputs. The same arguments always give
+the same input.
+
+Graphs are lists of (tail, head, weight) edges on vertices 1..vertices_num -
+the format of kruskal_mst.load_graph - and are converted to the formats of the
+other modules with to_digraph (dijkstra), to_undirected (prims_mst) and
+csr_graph.CSRGraph.from_edges (scc).
+"""
+import random
+
+
+def random_graph(vertices_num, degree=8, seed=0, max_weight=1000):
+    """
+    Returns edges of a random graph: every vertex gets degree edges to
+    uniformly chosen vertices, plus a path 1, 2, ..., vertices_num so that
+    every vertex is reachable from vertex 1.
+    """
+    rand = random.Random(seed)
+    edges = [(tail, tail + 1, rand.randint(1, max_weight)) for tail in xrange(1, vertices_num)]
+    for tail in xrange(1, vertices_num + 1):
+        for _ in xrange(degree):
+            edges.append((tail, rand.randint(1, vertices_num), rand.randint(1, max_weight)))
+    return edges
+
+
+def power_law_graph(vertices_num, degree=4, seed=0, max_weight=1000):
+    """
+    Returns edges of a preferential attachment (Barabasi-Albert) graph: every
+    new vertex is joined by edges from degree earlier vertices chosen with
+    probability proportional to their degrees, so degrees follow a power law
+    and a few hubs have very long adjacency lists.
+    """
+    rand = random.Random(seed)
+    edges = []
+    endpoints = [1] # Every vertex appears once per incident edge.
+    for tail in xrange(2, vertices_num + 1):
+        heads = set(rand.choice(endpoints) for _ in xrange(min(degree, tail - 1)))
+        for head in heads:
+            edges.append((head, tail, rand.randint(1, max_weight)))
+            endpoints.append(head)
+            endpoints.append(tail)
+    return edges
+
+
+def grid_graph(rows, columns, seed=0, max_weight=1000):
+    """
+    Returns edges of a rows x columns grid graph (like a road network, with a
+    large diameter). Vertex of row r and column c is r * columns + c + 1.
+    """
+    rand = random.Random(seed)
+    edges = []
+    for row in xrange(rows):
+        for column in xrange(columns):
+            vertex = row * columns + column + 1
+            if column + 1 < columns:
+                edges.append((vertex, vertex + 1, rand.randint(1, max_weight)))
+            if row + 1 < rows:
+                edges.append((vertex, vertex + columns, rand.randint(1, max_weight)))
+    return edges
+
+
+def scc_heavy_digraph(vertices_num, components_num=100, degree=4, seed=0):
+    """
+    Returns arcs (with weight 1) of a digraph whose vertices are split into
+    components_num strongly connected components of random sizes: each one is
+    a cycle with extra random arcs inside, and components are joined by arcs
+    going forward only, so the components form a DAG with long paths.
+    """
+    rand = random.Random(seed)
+    labels = range(1, vertices_num + 1)
+    rand.shuffle(labels)
+    cuts = sorted(rand.sample(xrange(1, vertices_num), min(components_num, vertices_num) - 1))
+    bounds = zip([0] + cuts, cuts + [vertices_num])
+    arcs = []
+    for number, (beginning, end) in enumerate(bounds):
+        members = labels[beginning:end]
+        for position, tail in enumerate(members):
+            arcs.append((tail, members[(position + 1) % len(members)], 1))
+            for _ in xrange(degree - 1):
+                arcs.append((tail, rand.choice(members), 1))
+        if number + 1 < len(bounds):
+            for _ in xrange(degree):
+                later = rand.randint(end, vertices_num - 1)
+                arcs.append((rand.choice(members), labels[later], 1))
+    return arcs
+
+
+def to_digraph(edges):
+    """
+    Converts edges into a directed graph modeled as a dictionary of
+    dictionaries (see dijkstra.load_graph). Parallel edges keep the last
+    weight.
+    """
+    digraph = {}
+    for tail, head, weight in edges:
+        digraph.setdefault(tail, {})[head] = weight
+        digraph.setdefault(head, {})
+    return digraph
+
+
+def to_undirected(edges):
+    """
+    Converts edges into an undirected graph modeled as a dictionary of lists
+    of (vertex, weight) tuples (see prims_mst.load_graph).
+    """
+    graph = {}
+    for tail, head, weight in edges:
+        graph.setdefault(tail, []).append((head, weight))
+        graph.setdefault(head, []).append((tail, weight))
+    return graph
+
+
+def sort_input(size, kind='random', seed=0):
+    """
+    Returns a list of integers to be sorted:
+    random      # uniformly distributed, mostly distinct
+    sorted      # already sorted (worst case of last-element pivots)
+    reversed    # sorted in decreasing order
+    organ_pipe  # increasing, then decreasing
+    sawtooth    # repeated increasing runs
+    few_unique  # only 8 distinct values (worst case of two-way partitions)
+    equal       # all elements equal
+    """
+    rand = random.Random(seed)
+    if kind == 'random':
+        return [rand.randint(0, size * 4) for _ in xrange(size)]
+    if kind == 'sorted':
+        return range(size)
+    if kind == 'reversed':
+        return range(size, 0, -1)
+    if kind == 'organ_pipe':
+        return range(size // 2) + range(size - size // 2, 0, -1)
+    if kind == 'sawtooth':
+        run = max(int(size ** 0.5), 1)
+        return [index % run for index in xrange(size)]
+    if kind == 'few_unique':
+        return [rand.randint(0, 7) for _ in xrange(size)]
+    if kind == 'equal':
+        return [0] * size
+    raise ValueError("Unknown kind of input %r" % (kind, ))
+
+
+def interval_input(size, kind='random', seed=0):
+    """
+    Returns a list of activities as tuples (start, finish):
+    random   # random starts and lengths
+    nested   # every activity contains the next one, so all of them overlap
+               (worst case of interval partitioning)
+    chained  # activities touching at their ends, all compatible
+    zero     # many activities that take no time, sharing start times
+    """
+    rand = random.Random(seed)
+    if kind == 'random':
+        tasks = []
+        for _ in xrange(size):
+            start = rand.randint(0, size * 4)
+            tasks.append((start, start + rand.randint(1, 40)))
+        return tasks
+    if kind == 'nested':
+        return [(index, 2 * size - index) for index in xrange(size)]
+    if kind == 'chained':
+        tasks = [(index, index + 1) for index in xrange(size)]
+        rand.shuffle(tasks)
+        return tasks
+    if kind == 'zero':
+        tasks = []
+        for _ in xrange(size):
+            start = rand.randint(0, size // 8 + 1)
+            tasks.append((start, start + rand.choice((0, 0, 0, 1))))
+        return tasks
+    raise ValueError("Unknown kind of input %r" % (kind, ))
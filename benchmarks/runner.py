@@ -0,0 +1,396 @@
+"""
+Runs benchmarks of the algorithms on inputs from benchmarks.generators.
+
+Every benchmark runs for every size in a fresh worker process, so the peak
+resident set size (the maximum RSS of the process, in KB, including the
+interpreter and the input) belongs to it alone. Wall time is the best of
+repeat runs without instrumentation, each on a freshly generated input.
+Operation counts are the counters and high-water marks recorded by
+instrumentation.Stats during one more run, plus whatever the benchmark
+reports (components found, ...). Benchmarks listed in CHECKS also have their
+reported counts compared with a reference algorithm; results that disagree are
+flagged as INVALID and make the runner exit with status 1.
+
+Cold start (benchmarks import_<module>) is the time to import every module of
+the algorithms package in a fresh interpreter (the best of COLD_START_REPEAT
+processes), with the peak RSS and the number of modules the import loaded -
+importing an algorithm should load almost nothing besides the algorithm itself
+(see algorithms.optional).
+
+Results of every run are appended to a JSON history file (not versioned).
+Results slower, bigger or doing more operations than the baseline by more
+than the tolerance are flagged and the runner exits with status 1. Times and
+memory depend on the machine, so no baseline is versioned: run once with
+--save-baseline on the machine that will be compared before anything is
+flagged. Times shorter than MIN_SECONDS (COLD_START_MIN_SECONDS
+for cold start) are too noisy to be compared.
+
+Usage (from the root of the repository):
+python -m benchmarks.runner [--only dijkstra_grid] [--scale 2] [--skip-cold-start]
+                            [--save-baseline]
+"""
+import argparse
+import json
+import os
+import pkgutil
+import resource
+import subprocess
+import sys
+import time
+from multiprocessing import Pool
+
+from benchmarks import generators
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_FILE = os.path.join(ROOT, 'benchmarks', 'history.json')
+BASELINE_FILE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+TOLERANCE = 0.25
+MIN_SECONDS = 0.05
+COLD_START_MIN_SECONDS = 0.002
+COLD_START_REPEAT = 5
+
+# Run by a fresh interpreter, prints import time, the number of modules loaded
+# and peak RSS.
+COLD_START_SCRIPT = """
+import resource, sys, time
+loaded = len(sys.modules)
+start = time.time()
+import %s
+print time.time() - start, len(sys.modules) - loaded, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
+
+
+def run_dijkstra(digraph, stats):
+    from algorithms.dijkstra import dijkstra
+    dijkstra(digraph, 1, stats=stats)
+    return {}
+
+
+def run_auto_dijkstra(digraph, stats):
+    from algorithms.bucket_dijkstra import auto_dijkstra
+    return {'reached': len(auto_dijkstra(digraph, 1)[0])}
+
+
+def run_prim(graph, stats):
+    from algorithms.prims_mst import mst_prim
+    mst_prim(graph, 1, stats=stats)
+    return {}
+
+
+def run_kruskal(edges, stats):
+    from algorithms.kruskal_mst import kruskal
+    return {'mst_edges': len(kruskal(edges, stats=stats))}
+
+
+def run_tarjan(graph, stats):
+    from algorithms.scc import tarjan
+    return {'components': len(tarjan(graph, stats)[1])}
+
+
+def run_kosaraju(graph, stats):
+    from algorithms.scc import dfs_order, dfs_leaders
+    order = dfs_order(graph.transpose(), stats)
+    return {'components': len(set(dfs_leaders(graph, order, stats)))}
+
+
+def run_incremental_scc(inp, stats):
+    index, edges = inp
+    index.stats = stats
+    return {'merged': index.insert_many(edges), 'components': index.components_num}
+
+
+def check_components(graph, counts):
+    """
+    Returns a message if the number of components differs from the number
+    found by tarjan, None otherwise.
+    """
+    from algorithms.scc import tarjan
+    expected = len(tarjan(graph)[1])
+    if counts['components'] != expected:
+        return "%s components, tarjan finds %s" % (counts['components'], expected)
+
+
+def run_introsort(inp, stats):
+    from algorithms.quick_sort import introsort
+    introsort(inp, stats=stats)
+    return {}
+
+
+def run_radix_sort(inp, stats):
+    from algorithms.radix_sort import radix_sort
+    radix_sort(inp)
+    return {}
+
+
+def run_select(inp, stats):
+    from algorithms.quick_select import select
+    select(inp, len(inp) // 2)
+    return {}
+
+
+def run_activity_batch(tasks, stats):
+    from algorithms.activity_selection_batch import select_activity_batch
+    starts = [task[0] for task in tasks]
+    finishes = [task[1] for task in tasks]
+    return {'selected': len(select_activity_batch(starts, finishes))}
+
+
+def run_weighted(tasks, stats):
+    from algorithms.interval_scheduling import select_weighted
+    return {'selected': len(select_weighted(tasks, [finish - start + 1 for start, finish in tasks])[1])}
+
+
+def run_partition(tasks, stats):
+    from algorithms.interval_scheduling import partition_intervals
+    return {'resources': partition_intervals(tasks)[0]}
+
+
+def run_schedule(tasks, stats):
+    from algorithms.activity_schedule import Schedule
+    tasks.sort(key=lambda task: (task[1], task[0]))
+    return {'selected': sum(1 for _ in Schedule().insert_greedy(tasks))}
+
+
+def grid_of(size, seed):
+    side = max(int(size ** 0.5), 1)
+    return generators.grid_graph(side, side, seed)
+
+
+def csr_of(edges):
+    from algorithms.csr_graph import CSRGraph
+    return CSRGraph.from_edges(edges)
+
+
+def incremental_scc_of(size, seed, inserted_num=1000):
+    """
+    Returns the index of an scc heavy digraph and inserted_num random arcs
+    to be inserted into it (only the insertions are timed).
+    """
+    import random
+    from algorithms.scc import IncrementalSCC
+    rand = random.Random(seed)
+    edges = [(rand.randint(1, size), rand.randint(1, size)) for _ in xrange(inserted_num)]
+    return IncrementalSCC(csr_of(generators.scc_heavy_digraph(size, seed=seed))), edges
+
+
+# name: (function generating input from size and seed, function running the
+# algorithm on it with a Stats object (or None) and returning other counts,
+# default sizes)
+BENCHMARKS = {
+    'dijkstra_random': (lambda size, seed: generators.to_digraph(generators.random_graph(size, seed=seed)),
+                        run_dijkstra, (10 ** 4, 10 ** 5)),
+    'dijkstra_power_law': (lambda size, seed: generators.to_digraph(generators.power_law_graph(size, seed=seed)),
+                           run_dijkstra, (10 ** 4, 10 ** 5)),
+    'dijkstra_grid': (lambda size, seed: generators.to_digraph(grid_of(size, seed)),
+                      run_dijkstra, (10 ** 4, 10 ** 5)),
+    'auto_dijkstra_grid': (lambda size, seed: generators.to_digraph(grid_of(size, seed)),
+                           run_auto_dijkstra, (10 ** 4, 10 ** 5)),
+    'prim_random': (lambda size, seed: generators.to_undirected(generators.random_graph(size, seed=seed)),
+                    run_prim, (10 ** 4, 10 ** 5)),
+    'prim_grid': (lambda size, seed: generators.to_undirected(grid_of(size, seed)),
+                  run_prim, (10 ** 4, 10 ** 5)),
+    'kruskal_random': (lambda size, seed: generators.random_graph(size, seed=seed),
+                       run_kruskal, (10 ** 4, 10 ** 5)),
+    'kruskal_power_law': (lambda size, seed: generators.power_law_graph(size, seed=seed),
+                          run_kruskal, (10 ** 4, 10 ** 5)),
+    'scc_tarjan': (lambda size, seed: csr_of(generators.scc_heavy_digraph(size, seed=seed)),
+                   run_tarjan, (10 ** 4, 10 ** 5)),
+    'scc_kosaraju': (lambda size, seed: csr_of(generators.scc_heavy_digraph(size, seed=seed)),
+                     run_kosaraju, (10 ** 4, 10 ** 5)),
+    'scc_incremental': (incremental_scc_of, run_incremental_scc, (10 ** 4, 10 ** 5)),
+    'introsort_random': (lambda size, seed: generators.sort_input(size, 'random', seed),
+                         run_introsort, (10 ** 4, 10 ** 5)),
+    'introsort_sorted': (lambda size, seed: generators.sort_input(size, 'sorted', seed),
+                         run_introsort, (10 ** 4, 10 ** 5)),
+    'introsort_organ_pipe': (lambda size, seed: generators.sort_input(size, 'organ_pipe', seed),
+                             run_introsort, (10 ** 4, 10 ** 5)),
+    'introsort_few_unique': (lambda size, seed: generators.sort_input(size, 'few_unique', seed),
+                             run_introsort, (10 ** 4, 10 ** 5)),
+    'radix_sort_random': (lambda size, seed: generators.sort_input(size, 'random', seed),
+                          run_radix_sort, (10 ** 4, 10 ** 5)),
+    'select_sawtooth': (lambda size, seed: generators.sort_input(size, 'sawtooth', seed),
+                        run_select, (10 ** 4, 10 ** 5)),
+    'activity_batch_random': (lambda size, seed: generators.interval_input(size, 'random', seed),
+                              run_activity_batch, (10 ** 4, 10 ** 5)),
+    'activity_batch_zero': (lambda size, seed: generators.interval_input(size, 'zero', seed),
+                            run_activity_batch, (10 ** 4, 10 ** 5)),
+    'weighted_random': (lambda size, seed: generators.interval_input(size, 'random', seed),
+                        run_weighted, (10 ** 4, 10 ** 5)),
+    'partition_nested': (lambda size, seed: generators.interval_input(size, 'nested', seed),
+                         run_partition, (10 ** 4, 10 ** 5)),
+    'schedule_chained': (lambda size, seed: generators.interval_input(size, 'chained', seed),
+                         run_schedule, (10 ** 4, 10 ** 5)),
+}
+
+# name: function taking the input and the counts reported by the benchmark,
+# returning a message if they are wrong (see measure)
+CHECKS = {
+    'scc_kosaraju': check_components,
+}
+
+
+def peak_rss():
+    """
+    Returns the peak resident set size of the process in KB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak # Bytes on OS X.
+
+
+def measure(name, size, seed=0, repeat=1):
+    """
+    Runs benchmark name on an input of the given size repeat times. Returns
+    dictionary of results, with an 'invalid' message if the counts fail the
+    check of the benchmark (see CHECKS). Meant to be run in a fresh process
+    (see run).
+    """
+    from algorithms.instrumentation import Stats
+    generate, algorithm, _ = BENCHMARKS[name]
+    best = float('inf')
+    for _ in xrange(repeat):
+        inp = generate(size, seed)
+        start = time.time()
+        algorithm(inp, None)
+        best = min(best, time.time() - start)
+        del inp
+    stats = Stats()
+    inp = generate(size, seed)
+    counts = algorithm(inp, stats)
+    result = {'benchmark': name, 'size': size, 'seconds': best,
+              'max_rss_kb': peak_rss(), 'counts': counts}
+    if name in CHECKS:
+        invalid = CHECKS[name](inp, counts)
+        if invalid is not None:
+            result['invalid'] = invalid
+    counts.update(stats.counters)
+    counts.update(('max_' + name, value) for name, value in stats.maxima.iteritems())
+    return result
+
+
+def run(names=None, scale=1, seed=0, repeat=1):
+    """
+    Runs the named benchmarks (all by default) for their default sizes
+    multiplied by scale, each in a fresh process. Returns list of results.
+    """
+    results = []
+    for name in sorted(names or BENCHMARKS):
+        for size in BENCHMARKS[name][2]:
+            pool = Pool(1)
+            try:
+                results.append(pool.apply(measure, (name, int(size * scale), seed, repeat)))
+            finally:
+                pool.terminate()
+            result = results[-1]
+            print "%-32s %9d %9.3f s %9d KB %s" % (
+                name, result['size'], result['seconds'], result['max_rss_kb'],
+                ' '.join('%s=%s' % item for item in sorted(result['counts'].iteritems())))
+            if 'invalid' in result:
+                print "INVALID %s (size %s): %s" % (name, result['size'], result['invalid'])
+    return results
+
+
+def package_modules():
+    """
+    Returns sorted names of the modules of the algorithms package.
+    """
+    path = [os.path.join(ROOT, 'algorithms')]
+    return sorted('algorithms.' + name for _, name, _ in pkgutil.iter_modules(path))
+
+
+def cold_start(modules=None, repeat=COLD_START_REPEAT):
+    """
+    Imports each of the modules (all modules of the package by default) in
+    repeat fresh interpreters. Returns list of results like run, with the
+    best import time, the peak RSS and the number of modules loaded by the
+    import.
+    """
+    results = []
+    for module in modules or package_modules():
+        best = None
+        for _ in xrange(repeat):
+            output = subprocess.check_output([sys.executable, '-c', COLD_START_SCRIPT % module],
+                                             cwd=ROOT)
+            seconds, loaded, peak = output.split()
+            if best is None or float(seconds) < best[0]:
+                best = float(seconds), int(loaded), int(peak)
+        peak = best[2] // 1024 if sys.platform == 'darwin' else best[2]
+        results.append({'benchmark': 'import_' + module.split('.')[-1], 'size': 0,
+                        'seconds': best[0], 'min_seconds': COLD_START_MIN_SECONDS,
+                        'max_rss_kb': peak, 'counts': {'modules_loaded': best[1]}})
+        print "%-32s %9d %9.4f s %9d KB modules_loaded=%s" % (
+            results[-1]['benchmark'], 0, best[0], peak, best[1])
+    return results
+
+
+def regressions(results, baseline, tolerance=TOLERANCE):
+    """
+    Compares results with baseline results. Returns list of messages about
+    results exceeding the baseline ones by more than tolerance (a fraction).
+    """
+    previous = dict(((result['benchmark'], result['size']), result) for result in baseline)
+    messages = []
+    for result in results:
+        base = previous.get((result['benchmark'], result['size']))
+        if base is None:
+            continue
+        measured = [('max_rss_kb', result['max_rss_kb'], base['max_rss_kb'])]
+        if base['seconds'] >= base.get('min_seconds', MIN_SECONDS):
+            measured.append(('seconds', result['seconds'], base['seconds']))
+        measured.extend((counter, value, base['counts'].get(counter))
+                        for counter, value in sorted(result['counts'].iteritems()))
+        for quantity, value, base_value in measured:
+            if base_value is not None and value > base_value * (1 + tolerance):
+                messages.append("%s (size %s): %s %s, baseline %s" % (
+                    result['benchmark'], result['size'], quantity, value, base_value))
+    return messages
+
+
+def load_json(file_name, default):
+    if not os.path.exists(file_name):
+        return default
+    with open(file_name) as opened:
+        return json.load(opened)
+
+
+def save_json(file_name, data):
+    with open(file_name, 'w') as opened:
+        json.dump(data, opened, indent=1, sort_keys=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs benchmarks of the algorithms.")
+    parser.add_argument('--only', nargs='*', choices=sorted(BENCHMARKS), metavar='NAME',
+                        help="benchmarks to run (all by default): %s" % ', '.join(sorted(BENCHMARKS)))
+    parser.add_argument('--scale', type=float, default=1, help="multiplier of the input sizes")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help="runs per input, the best is kept")
+    parser.add_argument('--history', default=HISTORY_FILE)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="stores the results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    parser.add_argument('--skip-cold-start', action='store_true',
+                        help="doesn't measure import time of the modules")
+    args = parser.parse_args(argv)
+    results = run(args.only, args.scale, args.seed, args.repeat)
+    if not args.skip_cold_start:
+        results.extend(cold_start())
+    history = load_json(args.history, [])
+    history.append({'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'python': sys.version.split()[0],
+                    'platform': sys.platform, 'seed': args.seed, 'results': results})
+    save_json(args.history, history)
+    if args.save_baseline:
+        save_json(args.baseline, results)
+        print "Baseline saved to", args.baseline
+        return 0
+    if not os.path.exists(args.baseline):
+        print "No baseline in %s, run with --save-baseline first" % args.baseline
+    messages = regressions(results, load_json(args.baseline, []), args.tolerance)
+    for message in messages:
+        print "REGRESSION", message
+    invalid = any('invalid' in result for result in results)
+    return 1 if messages or invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""
+Installs the algorithms package with a console script for every algorithm
+with a command line interface. NumPy is optional: pip install .[numpy]
+"""
+from setuptools import setup
+
+setup(
+    name='algorithms-in-python',
+    version='0.1.0',
+    description="Popular algorithms and data structures implemented in Python 2.7.",
+    packages=['algorithms'],
+    package_data={'algorithms': ['data/*.txt']},
+    python_requires='>=2.7, <3',
+    extras_require={'numpy': ['numpy']},
+    entry_points={
+        'console_scripts': [
+            'dijkstra = algorithms.dijkstra:main',
+            'prims-mst = algorithms.prims_mst:main',
+            'kruskal-mst = algorithms.kruskal_mst:main',
+            'scc = algorithms.scc:main',
+            'graph-snapshot = algorithms.graph_snapshot:main',
+            'bucket-dijkstra = algorithms.bucket_dijkstra:main',
+            'contraction-hierarchy = algorithms.contraction_hierarchy:main',
+            'quick-sort = algorithms.quick_sort:main',
+            'randomized-quick-sort = algorithms.randomized_quick_sort:main',
+            'radix-sort = algorithms.radix_sort:main',
+            'parallel-quick-sort = algorithms.parallel_quick_sort:main',
+            'quick-select = algorithms.quick_select:main',
+            'activity-selection = algorithms.activity_selection_batch:main',
+            'activity-schedule = algorithms.activity_schedule:main',
+            'interval-scheduling = algorithms.interval_scheduling:main',
+        ],
+    },
+)